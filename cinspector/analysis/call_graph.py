@@ -2,7 +2,7 @@
 Call Graph
 """
 
-from typing import Iterable
+from typing import Dict, Iterable, List
 from networkx import DiGraph  # type: ignore
 from cinspector.nodes import FunctionDefinitionNode, CallExpressionNode, VariadicParameterNode
 
@@ -56,15 +56,25 @@ class CallGraph:
         return name_check and para_num_check
 
     def analysis(self) -> DiGraph:
-        graph = DiGraph()
-        for _f in self.funcs:
-            graph.add_node(_f)
+        funcs = list(self.funcs)
+        # only the functions of the same name can be the callee
+        name_to_funcs: Dict[str, List[FunctionDefinitionNode]] = dict()
+        for _f in funcs:
+            if _f.name:
+                name_to_funcs.setdefault(_f.name.src, []).append(_f)
+
+        edges = []
+        for _f in funcs:
             # start analyzing each function
             calls = _f.descendants_by_type_name('call_expression')
             for _c in calls:
                 if _c.is_indirect():
                     continue
-                for _ in self.funcs:
+                for _ in name_to_funcs.get(_c.function.src, []):
                     if self.is_identical(_c, _):
-                        graph.add_edge(_f, _)
+                        edges.append((_f, _))
+
+        graph = DiGraph()
+        graph.add_nodes_from(funcs)
+        graph.add_edges_from(edges)
         return graph
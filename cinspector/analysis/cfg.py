@@ -2,8 +2,7 @@
 Control Flow Graph-related analysis
 """
 from networkx import DiGraph  # type: ignore
-import networkx as nx  # type: ignore
-from typing import Optional, Dict, Union, List
+from typing import Optional, Dict, Union, List, Iterator
 from cinspector.nodes import Util, BorderNode, Node
 from cinspector.nodes import ForStatementNode, YForLoopNode, NForLoopNode
 from cinspector.nodes import WhileStatementNode, YWhileLoopNode, NWhileLoopNode
@@ -27,11 +26,33 @@ class BaseCFG(Util):
         self.cfg = DiGraph()
         self.generate()
 
-    def execution_path(self):
-        path = list(nx.all_simple_paths(self.cfg, self.start, self.end))
-        # filter out start and end
-        path = [_[1:-1] for _ in path]
-        return path
+    def execution_path(self) -> Iterator[List[Node]]:
+        """
+        Generate all simple paths from <START> to <END>, both are excluded.
+
+        The paths are enumerated depth-first in the order of the successors,
+        one at a time. They share the prefix on a single stack, only the
+        complete path is copied when <END> is reached. Wrap the result with
+        list() if all the paths are needed at once.
+        """
+
+        succ = self.cfg.succ
+        path: List[Node] = []
+        on_path = {self.start}
+        # stack[i + 1] iterates the successors of path[i]
+        stack = [iter(succ[self.start])]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                if path:
+                    on_path.discard(path.pop())
+            elif child is self.end:
+                yield list(path)
+            elif child not in on_path:
+                path.append(child)
+                on_path.add(child)
+                stack.append(iter(succ[child]))
 
     def generate(self):
         """CFG.generate() generate the control flow graph"""
@@ -109,7 +130,7 @@ class BaseCFG(Util):
                     pred = list(self.cfg.predecessors(_c))
                     succ = list(self.cfg.successors(_c))
                     children = [
-                        _ for _ in _c.children if not _.node_type in ['{', '}']
+                        _ for _ in _c.children if not _.node_type in {'{', '}'}
                     ]
                     # skip empty compound statement
                     if not children:
@@ -223,7 +244,7 @@ class BaseCFG(Util):
                         _sw_node_lst.append(_sw_node)
                         _children = []
                         for _ in _case_statement.children:
-                            if _.node_type in ['case', ':', 'default']:
+                            if _.node_type in {'case', ':', 'default'}:
                                 continue
                             if _value and _.src == _value.src:
                                 continue
@@ -338,7 +359,7 @@ class BaseCFG(Util):
 
         for _g in goto_lst:
             label = _g.child_by_field_name('label').src
-            assert (label in list(label_map.keys()))
+            assert (label in label_map)
             if not isinstance(label_map[label], list):
                 label_map[label] = [label_map[label]]
             for _ in label_map[label]:
@@ -366,6 +387,6 @@ class CFG(BaseCFG):
         self.function_def = function_def
         stmt_lst = [
             _ for _ in self.function_def.body.children
-            if _.node_type not in ['{', '}']
+            if _.node_type not in {'{', '}'}
         ]
         super().__init__(stmt_lst)
@@ -11,8 +11,13 @@ CCode is the base interface for any interfaces that
 represent source code, such as CFile.
 """
 
-from typing import Dict, Callable
-from .nodes import BasicNode, Node
+import hashlib
+import os
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Callable, Optional
+from tree_sitter.binding import Query
+from .nodes import BasicNode, Node, Util
 
 
 class CProj:
@@ -24,13 +29,125 @@ class CProj:
 
 
 class CCode:
+    """ The interface of a C code snippet
+
+    Attributes:
+        src (str): the source code
+        node (BasicNode): the root node of the parsed tree
+    """
+
+    _QUERY_CACHE: Dict[str, Optional[Query]] = dict()
+
+    def __init__(self, src, parser=None) -> None:
+        """
+        Args:
+            src (str): the source code
+            parser (tree_sitter.Parser): parse src with the given parser
+                instead of the cached one of the current thread, the parsed
+                tree is not cached then.
+        """
 
-    def __init__(self, src) -> None:
         self.src = src
-        self.node = BasicNode(self.src)
+        if parser is None:
+            self.node = BasicNode(self.src)
+        else:
+            tree = parser.parse(self.src.encode('utf8'))
+            self.node = BasicNode(self.src, tree.root_node, tree)
+        # filled on the lookups, see get_by_type_name, get_function_by_name
+        # and get_by_type_name_and_query
+        self._type_index: Dict[str, list] = dict()
+        self._function_index: Optional[Dict[str, BasicNode]] = None
+        self._anonymous: Optional[Dict[int, list]] = None
+        self._query_indexes: Dict[tuple, Dict[Optional[str], list]] = dict()
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def from_source(src: str) -> 'CCode':
+        """
+        The CCode of src shared by the callers, the recently used ones are
+        kept. Unlike CCode(src), the lookup results (e.g., of
+        get_by_type_name) are shared as well. Note that every CCode of the
+        same source, shared or not, wraps the same cached tree (see
+        Util.get_tree), which Edit never modifies.
+        """
+
+        return CCode(src)
 
     def get_by_type_name(self, type_name: str) -> list:
-        return self.node.descendants_by_type_name(type_name)
+        """
+        Access the nodes of the type type_name in the depth-first order
+
+        The named types are matched by a compiled tree-sitter query, which
+        runs in C. The result of each type is kept, thus the following calls
+        only wrap the kept tree-sitter nodes.
+        """
+
+        if not isinstance(type_name, str):
+            return self.node.descendants_by_type_name(type_name)
+
+        ts_nodes = self._type_index.get(type_name)
+        if ts_nodes is None:
+            root = self.node.internal
+            query = self._type_query(type_name)
+            if query is None:
+                anonymous = self._anonymous_index()
+                ts_nodes = sorted((_n for _id in Util.kind_ids([type_name])
+                                   for _n in anonymous.get(_id, [])),
+                                  key=attrgetter('start_byte'))
+            else:
+                # the captures are in the depth-first order, the root node
+                # itself is not its descendant
+                ts_nodes = [
+                    _n for _n, _ in query.captures(root) if _n.id != root.id
+                ]
+            self._type_index[type_name] = ts_nodes
+
+        make_wrapper = self.node.make_wrapper
+        return [make_wrapper(_n) for _n in ts_nodes]
+
+    def _anonymous_index(self) -> Dict[int, list]:
+        """
+        The anonymous tree-sitter nodes (e.g., ';') bucketed by kind id in
+        the depth-first order. A query cannot match them, they are thus
+        collected for all the anonymous types in one walk.
+        """
+
+        if self._anonymous is None:
+            index: Dict[int, list] = dict()
+            for _n, _ in self.node._walk_raw():
+                if not _n.is_named:
+                    index.setdefault(_n.kind_id, []).append(_n)
+            self._anonymous = index
+        return self._anonymous
+
+    @classmethod
+    def _type_query(cls, type_name: str):
+        """
+        The query (type_name) @node compiled once for all CCode, None if
+        type_name is not a named type (e.g., ';') that a query can match.
+        """
+
+        if type_name not in cls._QUERY_CACHE:
+            try:
+                query = Util._get_language().query(f'({type_name}) @node')
+            except (NameError, SyntaxError):
+                query = None
+            cls._QUERY_CACHE[type_name] = query
+        return cls._QUERY_CACHE[type_name]
+
+    def get_function_by_name(self, name: str) -> Optional[BasicNode]:
+        """
+        Access the function definition named name, the first one is returned
+        if there are several definitions (e.g., in different #if branches).
+        """
+
+        if self._function_index is None:
+            index: Dict[str, BasicNode] = dict()
+            for _f in self.get_by_type_name('function_definition'):
+                if _f.name:
+                    index.setdefault(_f.name.src, _f)
+            self._function_index = index
+        return self._function_index.get(name)
 
     def get_by_condition(self, condition: Callable[[Node], bool]) -> list:
         """
@@ -42,8 +159,43 @@ class CCode:
 
     def get_by_type_name_and_query(self, type_name: str,
                                    query: Dict[str, str]) -> list:
-        n_lst = self.get_by_type_name(type_name)
-        return [n for n in n_lst if n.query(query)]
+        """
+        Access the nodes of the type type_name that satisfy the query
+
+        The nodes of type_name are matched by the query compiled once per
+        type (see _type_query). For the first query key, the nodes are
+        indexed by their value of the key once, thus the following calls
+        only wrap the matched nodes. The other keys are checked by
+        Query.query since they map to node properties rather than children.
+        """
+
+        if not query:
+            return self.get_by_type_name(type_name)
+        (key, value), *rest = query.items()
+        ts_nodes = self._query_index(type_name, key).get(value, [])
+
+        make_wrapper = self.node.make_wrapper
+        result = [make_wrapper(_n) for _n in ts_nodes]
+        if rest:
+            rest_query = dict(rest)
+            result = [n for n in result if n.query(rest_query)]
+        return result
+
+    def _query_index(self, type_name: str,
+                     key: str) -> Dict[Optional[str], list]:
+        """
+        The tree-sitter nodes of the type type_name grouped by their value of
+        the query key, in the depth-first order.
+        """
+
+        index = self._query_indexes.get((type_name, key))
+        if index is None:
+            index = dict()
+            for _n in self.get_by_type_name(type_name):
+                value = getattr(_n, _n._MAPPING[key])()
+                index.setdefault(value, []).append(_n.internal)
+            self._query_indexes[(type_name, key)] = index
+        return index
 
     def get_by_type_name_and_field(self, type_name: str,
                                    field: Dict[str, str]) -> list:
@@ -73,8 +225,47 @@ class CCode:
 
 
 class CFile(CCode):
-    """ TODO
+    """ The interface of a C source file
+
+    The file is parsed at initialization. For tools that keep inspecting
+    the same files, reload() re-parses the file only if its content has
+    changed.
+
+    Attributes:
+        file_path (str): the path of the source file
     """
 
-    def __init__(self, file_path) -> None:
+    def __init__(self, file_path: str) -> None:
         self.file_path = file_path
+        # sha256 of the content that <node> is parsed from
+        self._digest: Optional[str] = None
+        self._mtime: Optional[int] = None
+        self.reload()
+
+    def reload(self) -> bool:
+        """ Synchronize with the file on disk
+
+        The file is re-read only if its mtime has changed, and re-parsed
+        only if the sha256 of the content has changed.
+
+        Return:
+            True if the file is re-parsed, otherwise False
+        """
+
+        mtime = os.stat(self.file_path).st_mtime_ns
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        with open(self.file_path, 'r', errors='ignore') as r:
+            src = r.read()
+        src_bytes = src.encode('utf8')
+        digest = hashlib.sha256(src_bytes).hexdigest()
+        if digest == self._digest:
+            return False
+        self._digest = digest
+        # parse the bytes already encoded for the digest, BasicNode then
+        # reuses the cached tree instead of encoding src again
+        Util().get_tree(src, src_bytes)
+        super().__init__(src)
+        return True
@@ -49,18 +49,18 @@ class IfConditionNode(AbstractNode):
 
         This function also a one-dimension list.
         """
-        common_constraints = []
-        e_cons = self.entry_constraints()
-        # the comparison can be conducted by BasicNode.src or BasicNode.equal()
-        for _e in e_cons[0]:  # checking the first is enough
-            yes = True
-            for _cons in e_cons[1:]:
-                _cons_src = [_.src for _ in _cons]
-                if _e.src not in _cons_src:
-                    yes = False
-            if yes:
-                common_constraints.append(_e)
-        return common_constraints
+        atoms: list = []
+        clauses = self._constraint_masks(self.condition, atoms)
+        # the comparison can be conducted by BasicNode.src or BasicNode.equal(),
+        # the atoms of the same src are merged into one mask
+        src_masks: dict = dict()
+        for _i, _a in enumerate(atoms):
+            src_masks[_a.src] = src_masks.get(_a.src, 0) | 1 << _i
+        # checking the first is enough
+        return [
+            _e for _e in self._materialize(clauses[0], atoms)
+            if all(_c & src_masks[_e.src] for _c in clauses[1:])
+        ]
 
     def entry_constraints(self):
         """
@@ -70,9 +70,22 @@ class IfConditionNode(AbstractNode):
         if (a || (a < 1 && a > 0)) -> (a) (a < 1, a > 0)
         if (b && (a < 1 || a > 0)) -> (b, a < 1) (b, a > 0)
         """
-        return self._constraints(self.condition)
+        atoms: list = []
+        clauses = self._constraint_masks(self.condition, atoms)
+        return [self._materialize(_c, atoms) for _c in clauses]
+
+    @staticmethod
+    def _materialize(clause: int, atoms: list) -> list:
+        # the atoms are numbered in the source order
+        return [_a for _i, _a in enumerate(atoms) if clause >> _i & 1]
+
+    def _constraint_masks(self, node, atoms: list) -> list:
+        """
+        Each atomic constraint is appended to atoms and stands for one bit,
+        an entry constraint (conjunction) is the int mask of its atoms.
+        Every atom occurs in the condition once, the masks thus lose nothing.
+        """
 
-    def _constraints(self, node):
         from .basic_node import ParenthesizedExpressionNode, BinaryExpressionNode
         # proud of elegant code :-)
         if isinstance(node, ParenthesizedExpressionNode):
@@ -81,22 +94,23 @@ class IfConditionNode(AbstractNode):
 
         if isinstance(node, BinaryExpressionNode):
             if node.symbol == '||':
-                return self._constraints(node.left) + self._constraints(
-                    node.right)
+                _left_masks = self._constraint_masks(node.left, atoms)
+                return _left_masks + self._constraint_masks(node.right, atoms)
             if node.symbol == '&&':
                 """
                 [[a,b], [c,d]] && [[e,f]] -> [[a,b,e,f], [c,d,e,f]]
                 """
-                ret = []
-                _right_constraints = self._constraints(node.right)
-                for _left in self._constraints(node.left):
-                    for _right in _right_constraints:
-                        ret.append(_left + _right)
-                return ret
-            if node.symbol in ['>', '<', '>=', '<=', '==']:
-                return [[node]]
-
-        return [[node]]
+                _left_masks = self._constraint_masks(node.left, atoms)
+                _right_masks = self._constraint_masks(node.right, atoms)
+                return [
+                    _left | _right
+                    for _left in _left_masks
+                    for _right in _right_masks
+                ]
+
+        # comparisons like a > b and the other expressions are atomic
+        atoms.append(node)
+        return [1 << (len(atoms) - 1)]
 
 
 class YConditionNode(IfConditionNode):
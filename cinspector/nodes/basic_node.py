@@ -22,8 +22,179 @@ ParameterDeclarationNode is an instance of IdentifierNode instead of str. Of
 course, the user can also get the str format by invoking the method src().
 """
 
-from typing import List, Optional, Dict, Iterable, Union
-from .node import Node, Util, Query
+import weakref
+from array import array
+from typing import AbstractSet, List, Optional, Dict, Iterable, Sequence, Union
+from .node import Node, Util, Query, lazy_property
+
+# tree-sitter nodes that are omitted from BasicNode.children
+_PUNCT_TYPES = frozenset({'(', ')', ',', ';', '{', '}'})
+
+# children of declaration that are declarators
+_DECLARATOR_TYPES = frozenset({
+    'pointer_declarator', 'array_declarator', 'identifier', 'init_declarator',
+    'function_declarator'
+})
+
+# declarators that wrap another declarator in the field declarator
+_DECLARATOR_UNPACK = frozenset({
+    'pointer_declarator', 'array_declarator', 'init_declarator',
+    'function_declarator'
+})
+
+# declarators counted by TypeNode.pointer_level and TypeNode.array_level
+_POINTER_DECLARATOR_TYPES = frozenset(
+    {'pointer_declarator', 'abstract_pointer_declarator'})
+_ARRAY_DECLARATOR_TYPES = frozenset(
+    {'array_declarator', 'abstract_array_declarator'})
+
+# children picked by FieldDeclarationListNode.iter_field_declarations
+_FIELD_DECLARATION_TYPES = frozenset({'field_declaration'})
+
+# field names pre-bound for the raw tree-sitter walks
+_F_DECLARATOR = b'declarator'
+_F_PARAMETERS = b'parameters'
+_F_NAME = b'name'
+_F_VALUE = b'value'
+
+# subtrees of these types never contain identifiers
+_NO_IDENTIFIER_TYPES = frozenset(
+    {'string_literal', 'char_literal', 'comment', 'preproc_arg'})
+
+
+class _TreeCache:
+    """ Side table shared by all the wrappers of one tree-sitter tree
+
+    tree_sitter.Tree accepts neither new attributes nor weak references, so
+    the side table is registered by id(tree) instead. It holds the tree, thus
+    the id cannot be reused by another tree while the table is alive. The
+    table itself lives as long as any wrapper of the tree does.
+
+    The tables are hit once per wrapper, so both of them are plain dicts of
+    callback-free weakref.ref, whose lookups stay in C, rather than
+    WeakValueDictionary, whose get() and setdefault() run Python code. A dead
+    reference in <wrappers> is simply replaced by the next wrapper of the
+    node, so the dict is bounded by the size of the tree.
+
+    Attributes:
+        tree (tree_sitter.Tree): the tree this table belongs to.
+        wrappers (Dict[int, weakref.ref]): maps the id of tree-sitter nodes
+            to the weak references of their wrappers.
+        src_bytes (Optional[bytes]): the utf-8 source of the tree, which the
+            byte offsets of tree-sitter nodes index into.
+        parents (Dict[int, tree_sitter.Node]): maps the id of the recently
+            looked up tree-sitter nodes to their parents, at most
+            PARENTS_SIZE entries and the oldest one is dropped first.
+        shared (bool): whether the tree is served by Util.get_tree, thus
+            shared by other code snippets and must not be edited in place.
+    """
+
+    __slots__ = ('tree', 'wrappers', 'src_bytes', 'parents', 'shared',
+                 '__weakref__')
+
+    # tree_sitter.Node.parent searches from the root, which is costly for
+    # the deep nodes, while the lookups mostly repeat on a few nodes
+    PARENTS_SIZE = 32
+
+    def __init__(self, tree) -> None:
+        self.tree = tree
+        self.src_bytes: Optional[bytes] = None
+        self.wrappers: Dict[int, weakref.ref] = {}
+        self.parents: Dict[int, object] = {}
+        self.shared = False
+
+    def parent_of(self, ts_node):
+        parents = self.parents
+        try:
+            return parents[ts_node.id]
+        except KeyError:
+            parent = ts_node.parent
+            if len(parents) >= self.PARENTS_SIZE:
+                del parents[next(iter(parents))]
+            parents[ts_node.id] = parent
+            return parent
+
+
+_TREE_CACHES: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+# the table used last, wrappers are mostly made in bulk for one tree
+_LAST_TREE_CACHE = weakref.ref(_TreeCache(None))
+
+
+def _get_tree_cache(tree) -> _TreeCache:
+    # ids of tree-sitter nodes are only unique within one tree
+    global _LAST_TREE_CACHE
+    if tree is None:
+        return _TreeCache(tree)
+    cache = _LAST_TREE_CACHE()
+    if cache is not None and cache.tree is tree:
+        return cache
+    cache = _TREE_CACHES.get(id(tree))
+    if cache is None:
+        cache = _TreeCache(tree)
+        _TREE_CACHES[id(tree)] = cache
+    _LAST_TREE_CACHE = weakref.ref(cache)
+    return cache
+
+
+class TokenList(Sequence):
+    """
+    The tokens returned by BasicNode.tokenize. The tokens are stored as the
+    parallel arrays of their byte offsets, and wrapped into BasicNode only
+    when they are indexed or iterated.
+
+    Attributes:
+        starts (array): the start bytes of the tokens
+        ends (array): the end bytes of the tokens
+    """
+
+    __slots__ = ('starts', 'ends', '_owner', '_ts_nodes')
+
+    def __init__(self, owner: 'BasicNode', ts_nodes: list) -> None:
+        self._owner = owner
+        self._ts_nodes = ts_nodes
+        self.starts = array('I', [_n.start_byte for _n in ts_nodes])
+        self.ends = array('I', [_n.end_byte for _n in ts_nodes])
+
+    def get_src(self, i: int) -> str:
+        return self._owner.internal_src_bytes[self.starts[i]:self.
+                                              ends[i]].decode('utf8')
+
+    def src_bytes(self) -> List[bytes]:
+        """ the utf-8 src of every token, without decoding """
+
+        src_bytes = self._owner.internal_src_bytes
+        return [src_bytes[_s:_e] for _s, _e in zip(self.starts, self.ends)]
+
+    def srcs(self) -> List[str]:
+        """ the src of every token, without wrapping the tokens """
+
+        src_bytes = self._owner.internal_src_bytes
+        return [
+            src_bytes[_s:_e].decode('utf8')
+            for _s, _e in zip(self.starts, self.ends)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._ts_nodes)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._owner.make_wrapper(_n) for _n in self._ts_nodes[i]]
+        return self._owner.make_wrapper(self._ts_nodes[i])
+
+    def __iter__(self):
+        make_wrapper = self._owner.make_wrapper
+        for _n in self._ts_nodes:
+            yield make_wrapper(_n)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TokenList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self.srcs())
 
 
 class BasicNode(Node, Util, Query):
@@ -64,21 +235,38 @@ class BasicNode(Node, Util, Query):
         src (str): the source code of the current node.
 
     Properties:
+        internal_src_bytes (bytes): the utf-8 encoded internal_src, which the
+            byte offsets of tree-sitter nodes index into. It is shared by all
+            the nodes of the same tree.
+        src_bytes (bytes): the utf-8 source code of the current node, sliced
+            from internal_src_bytes without decoding.
+        kind_id (int): the id of the node kind, see Util.kind_ids.
         parent (BasicNode): the parent node of the current node.
         children (List[BasicNode]): the children nodes of the current node.
+            iter_children() iterates them lazily.
 
     Methods:
-        equal(_o: 'BasicNode'): check whether the current node is equal to _o.
+        equal(_o: 'BasicNode'): check whether the current node is at the same
+            position of the same code snippet as _o. The operator == further
+            requires the same node_type.
         make_wrapper(ts_node: tree-sitter.Node): make a wrapper class for the
             tree-sitter node.
         child_by_field_name(field_name: str): get the specific field of the
             current node.
         descendants(): get all descendants.
+        children_by_type_name(type_name: Union[str, List[str]): get the
+            children nodes belonging to the specific type.
         descendants_by_type_name(type_name: Union[str, List[str]): get the
             descendants nodes belonging to the specific type.
         print_tree(): print the parsed tree
     """
 
+    # the wrappers are created in bulk, __slots__ saves the per-instance
+    # __dict__; __weakref__ is kept for the wrapper cache of the tree
+    __slots__ = ('internal_src', 'internal', 'internal_tree', '_tree_cache',
+                 '_parent', '_children', '_lazy_src', '_lazy_node_type',
+                 '_lazy__child_buckets', '__weakref__')
+
     def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
         """
         Initialize the BasicNode
@@ -102,20 +290,77 @@ class BasicNode(Node, Util, Query):
         passed to BasicNode. Other nodes such as FunctionDefinitionNode
         should be initialized with ts_node dictated.
         """
-        if not ts_node:
+        shared = not ts_node
+        if shared:
             ts_tree = self.get_tree(src)
             ts_node = ts_tree.root_node
         self.internal = ts_node
         self.internal_tree = ts_tree
-        self.node_type = ts_node.type
-        # ts_type: deprecated, node_type should be totally consistent with the type of tree-sitter node
-        self.ts_type = ts_node.type
+        self._tree_cache = _get_tree_cache(ts_tree)
+        if shared:
+            self._tree_cache.shared = True
+        wrappers = self._tree_cache.wrappers
+        ref = wrappers.get(ts_node.id)
+        if ref is None or ref() is None:
+            wrappers[ts_node.id] = weakref.ref(self)
         self._parent = None
-        self.start_point = ts_node.start_point
-        self.end_point = ts_node.end_point
-        self.child_count = ts_node.child_count
         self._children = None
-        self.src = self.internal.text.decode("utf8")
+
+    # the following attributes are read from the tree-sitter node on demand
+    # rather than copied into every wrapper
+
+    @lazy_property
+    def node_type(self) -> str:
+        # tree-sitter creates a new str on every access, the interned name
+        # of the kind is looked up by its int id instead, and compared with
+        # the literal type names by identity first
+        return Util.kind_name(self.internal.kind_id)
+
+    @property
+    def ts_type(self) -> str:
+        # deprecated, node_type should be totally consistent with the type of tree-sitter node
+        return self.node_type
+
+    @property
+    def start_point(self) -> tuple:
+        return self.internal.start_point
+
+    @property
+    def end_point(self) -> tuple:
+        return self.internal.end_point
+
+    @property
+    def start_byte(self) -> int:
+        return self.internal.start_byte
+
+    @property
+    def end_byte(self) -> int:
+        return self.internal.end_byte
+
+    @property
+    def child_count(self) -> int:
+        return self.internal.child_count
+
+    @property
+    def internal_src_bytes(self) -> bytes:
+        """ The utf-8 bytes of internal_src, shared within the tree """
+
+        cache = self._tree_cache
+        if cache.src_bytes is None:
+            # the tree keeps the bytes it was parsed from
+            cache.src_bytes = self.internal_tree.text \
+                if self.internal_tree else self.internal_src.encode('utf8')
+        return cache.src_bytes
+
+    @property
+    def src_bytes(self) -> bytes:
+        internal = self.internal
+        return self.internal_src_bytes[internal.start_byte:internal.end_byte]
+
+    @lazy_property
+    def src(self) -> str:
+        # decoded on demand, most wrappers made by traversals never need it
+        return self.src_bytes.decode("utf8")
 
     @property
     def children(self):
@@ -123,14 +368,46 @@ class BasicNode(Node, Util, Query):
         DO NOT use this attribute on huge BasicNode such as ndoe
         of file, otherwise horrible recursion.
         """
-        if not self._children:
-            self._children = [
-                self.make_wrapper(_ch)
-                for _ch in self.internal.children
-                # TODO: Maybe it's better to keep them for consistency.
-                if _ch.type not in ['(', ')', ',', ';', '{', '}']
+        if self._children is None:
+            self._children = list(self.iter_children())
+        # a copy, the wrappers are shared, so is the cached list
+        return list(self._children)
+
+    def iter_children(self):
+        """
+        Lazily iterate the nodes in <children>, a child is wrapped only
+        when it is reached.
+        """
+
+        punct = Util.kind_ids(_PUNCT_TYPES)
+        for _ch in self.internal.children:
+            # TODO: Maybe it's better to keep them for consistency.
+            if _ch.kind_id not in punct:
+                child = self.make_wrapper(_ch)
+                # the parent is known here, tree-sitter would search it from
+                # the root of the tree
+                if child._parent is None:
+                    child._parent = self
+                yield child
+
+    def _nth_child(self, index: int):
+        """
+        Get children[index] (or None if index is out of range) without
+        wrapping the other children.
+        """
+
+        if self._children:
+            ts_children = self._children
+        else:
+            punct = Util.kind_ids(_PUNCT_TYPES)
+            ts_children = [
+                _ch for _ch in self.internal.children
+                if _ch.kind_id not in punct
             ]
-        return self._children
+        if not -len(ts_children) <= index < len(ts_children):
+            return None
+        child = ts_children[index]
+        return child if self._children else self.make_wrapper(child)
 
     def __str__(self) -> str:
         # return f'({self.type}){self.src}'
@@ -142,150 +419,220 @@ class BasicNode(Node, Util, Query):
 
     def equal(self, _o: 'BasicNode') -> bool:
         assert (isinstance(_o, BasicNode))
-        internal_src_eq = (self.internal_src == _o.internal_src)
-        position_eq = (self.internal.start_point == _o.internal.start_point)
-        position_eq = position_eq and (self.internal.end_point
-                                       == _o.internal.end_point)
-        return internal_src_eq and position_eq
+        # nodes of one code snippet share the same internal_src object
+        internal_src_eq = (self.internal_src is _o.internal_src) or \
+            (self.internal_src == _o.internal_src)
+        return self.internal.start_byte == _o.internal.start_byte \
+            and self.internal.end_byte == _o.internal.end_byte \
+            and internal_src_eq
+
+    def __eq__(self, _o) -> bool:
+        """
+        Two wrappers are equal if they wrap the same node of the same
+        code snippet, i.e., the same position and the same node_type.
+        """
+
+        if not isinstance(_o, BasicNode):
+            return NotImplemented
+        return self.equal(_o) and self.node_type == _o.node_type
+
+    def __hash__(self) -> int:
+        return hash((self.internal.start_byte, self.internal.end_byte))
 
     @property
     def parent(self):
-        if not self._parent:
-            self._parent = self.make_wrapper(self.internal.parent)
+        if self._parent is None:
+            self._parent = self.make_wrapper(
+                self._tree_cache.parent_of(self.internal))
         return self._parent
 
     def in_front(self, node: 'BasicNode'):
-        return self.start_point[0] < node.start_point[0] or \
-            (self.start_point[0] == node.start_point[0] and self.start_point[1] < node.start_point[1])
+        # the byte offset orders the nodes of one tree as their start points
+        return self.internal.start_byte < node.internal.start_byte
 
     def make_wrapper(self, ts_node):
+        """
+        Wrap ts_node with the corresponding wrapper class. The live wrapper
+        of ts_node within the same tree is reused if there is one.
+        """
+
         if not ts_node:
             return None
-        wrapper_dict = {
-            'assignment_expression': AssignmentExpressionNode,
-            'binary_expression': BinaryExpressionNode,
-            'call_expression': CallExpressionNode,
-            'cast_expression': CaseExpressionNode,
-            'conditional_expression': ConditionalExpressionNode,
-            'compound_statement': CompoundStatementNode,
-            'declaration': DeclarationNode,
-            'do_statement': DoStatementNode,
-            'enum_specifier': EnumSpecifierNode,
-            'enumerator_list': EnumeratorListNode,
-            'enumerator': EnumeratorNode,
-            'expression_statement': ExpressionStatementNode,
-            'field_identifier': FieldIdentifierNode,
-            'field_declaration_list': FieldDeclarationListNode,
-            'field_declaration': FieldDeclarationNode,
-            'function_definition': FunctionDefinitionNode,
-            'function_declarator': FunctionDeclaratorNode,
-            'for_statement': ForStatementNode,
-            'if_statement': IfStatementNode,
-            'init_declarator': InitDeclaratorNode,
-            'identifier': IdentifierNode,
-            'type_identifier': TypeIdentifierNode,
-            'primitive_type': TypeNode,
-            'number_literal': NumberLiteralNode,
-            'parenthesized_expression': ParenthesizedExpressionNode,
-            'preproc_function_def': PreprocFunctionDefNode,
-            'preproc_def': PreprocDefNode,
-            'preproc_arg': PreprocArgNode,
-            'parameter_declaration': ParameterDeclarationNode,
-            'parameter_list': ParameterListNode,
-            'return_statement': ReturnStatementNode,
-            'struct_specifier': StructSpecifierNode,
-            'subscript_expression': SubscriptExpressionNode,
-            'storage_class_specifier': StorageClassSpecifierNode,
-            'sized_type_specifier': TypeNode,
-            'macro_type_specifier': TypeNode,
-            'type_qualifier': TypeQualifierNode,
-            'type_identifier': TypeIdentifierNode,
-            'unary_expression': UnaryExpressionNode,
-            'variadic_parameter': VariadicParameterNode,
-            'while_statement': WhileStatementNode,
-        }
-        init_func = wrapper_dict[
-            ts_node.type] if ts_node.type in wrapper_dict.keys() else BasicNode
-        return init_func(self.internal_src, ts_node, self.internal_tree)
+        ref = self._tree_cache.wrappers.get(ts_node.id)
+        wrapper = ref() if ref is not None else None
+        if wrapper is None:
+            kind_id = ts_node.kind_id
+            init_func = _WRAPPERS_BY_KIND.get(kind_id)
+            if init_func is None:
+                # kind_name also names the ids out of the kind table, e.g.,
+                # ERROR nodes, which are wrapped by BasicNode
+                init_func = _WRAPPER_DICT.get(Util.kind_name(kind_id),
+                                              BasicNode)
+                _WRAPPERS_BY_KIND[kind_id] = init_func
+            wrapper = init_func(self.internal_src, ts_node, self.internal_tree)
+        return wrapper
+
+    def _child_by_field_name_raw(self, name: Union[str, bytes]):
+        """
+        The unwrapped version of child_by_field_name, for the walks that only
+        inspect the field before stepping further.
+        """
+
+        return self.internal.child_by_field_name(name)
+
+    @property
+    def kind_id(self) -> int:
+        return self.internal.kind_id
+
+    def is_kind(self, kind_ids: AbstractSet[int]) -> bool:
+        """
+        Whether the node is of one of the node kinds, e.g.,
+        node.is_kind(Util.kind_ids(['if_statement'])). Comparing the int ids
+        is cheaper than comparing node_type or checking the wrapper class.
+        """
+
+        return self.internal.kind_id in kind_ids
 
     def child_by_field_name(self, name: str):
-        assert (type(name) == str)
-        return self.make_wrapper(self.internal.child_by_field_name(name))
+        return self.make_wrapper(self._child_by_field_name_raw(name))
 
-    def descendants(self):
+    def children_by_type_name(self, name: Union[str, Iterable[str]]):
         """
-        Depth-first traverse to collect all descendants of the
-        current node, the current node itself will not be collected.
+        Collect the children that satisfy the node_type requirements. Only
+        the satisfied children are wrapped.
+        """
+
+        if isinstance(name, str):
+            name = [name]
+        buckets = self._child_buckets
+        kind_ids = [_k for _k in Util.kind_ids(name) if _k in buckets]
+        if len(kind_ids) == 1:
+            bucket = buckets[kind_ids[0]]
+        else:
+            # restore the order of the children across the buckets, a type
+            # name may also be shared by several kinds
+            bucket = sorted(_ch for _k in kind_ids for _ch in buckets[_k])
+
+        return [self.make_wrapper(_ch) for _, _ch in bucket]
+
+    @lazy_property
+    def _child_buckets(self) -> Dict[int, list]:
+        # inner property, the (index, tree-sitter node) of the children
+        # bucketed by their kind ids
+        buckets: Dict[int, list] = dict()
+        for _i, _ch in enumerate(self.internal.children):
+            buckets.setdefault(_ch.kind_id, []).append((_i, _ch))
+        return buckets
+
+    def _walk_raw(self,
+                  skip_types: AbstractSet[str] = frozenset(),
+                  with_root: bool = False):
         """
+        Depth-first traverse the tree-sitter nodes below the current node
+        without wrapping them. Yield (ts_node, depth) where the current node
+        is of depth 0.
 
-        node_lst = []
+        Args:
+            skip_types: the descendants of these types are yielded while
+                their subtrees are not traversed.
+            with_root: whether to yield the current node itself.
+        """
+
+        skip_ids = Util.kind_ids(skip_types)
         cursor = self.internal.walk()
-        root_node = cursor.node
+        if with_root:
+            yield cursor.node, 0
+        if not cursor.goto_first_child():
+            return
+        depth = 1
         while True:
-            if cursor.node != root_node:
-                node_lst.append(self.make_wrapper(cursor.node))
-            if not cursor.goto_first_child():
-                while not cursor.goto_next_sibling():
-                    if not cursor.goto_parent():
-                        return node_lst
+            ts_node = cursor.node
+            yield ts_node, depth
+            if ts_node.kind_id not in skip_ids and cursor.goto_first_child():
+                depth += 1
+                continue
+            while not cursor.goto_next_sibling():
+                depth -= 1
+                if depth == 0:
+                    return
+                cursor.goto_parent()
+
+    def descendants(self, skip_types: AbstractSet[str] = frozenset()):
+        """
+        Depth-first traverse to collect all descendants of the
+        current node, the current node itself will not be collected.
+
+        Args:
+            skip_types: the descendants of these types are collected while
+                their subtrees are not traversed.
+        """
 
-    def descendants_by_type_name(self, name: Union[str, List[str]]):
+        return [self.make_wrapper(_n) for _n, _ in self._walk_raw(skip_types)]
+
+    def descendants_by_type_name(self,
+                                 name: Union[str, List[str]],
+                                 skip_types: AbstractSet[str] = frozenset()):
         """
         Depth-first traverse to collect all descendants that satisfy the node_type
         requirements.
+
+        Only the matched tree-sitter nodes are wrapped.
+
+        Args:
+            name: the required node_type(s).
+            skip_types: the subtrees of these types are not traversed, e.g.,
+                string_literal when searching identifiers.
         """
 
-        if type(name) == str:
+        if isinstance(name, str):
             name = [name]
+        types = Util.kind_ids(name)
+        skip_types = Util.kind_ids(skip_types)
 
-        return [_ for _ in self.descendants() if _.node_type in name]
-
-    def tokenize(self) -> List['BasicNode']:
+        # the same walk as _walk_raw, inlined since it is the hottest
+        # traversal and only the matched nodes are handled in Python
+        hits: list = []
+        cursor = self.internal.walk()
+        if not cursor.goto_first_child():
+            return hits
+        depth = 1
+        while True:
+            ts_node = cursor.node
+            ts_type = ts_node.kind_id
+            if ts_type in types:
+                hits.append(ts_node)
+            if ts_type not in skip_types and cursor.goto_first_child():
+                depth += 1
+                continue
+            while not cursor.goto_next_sibling():
+                depth -= 1
+                if depth == 0:
+                    make_wrapper = self.make_wrapper
+                    return [make_wrapper(_n) for _n in hits]
+                cursor.goto_parent()
+
+    def tokenize(self) -> TokenList:
         """Tokenize the current code snippet
 
         Returns:
-            A list (order-sensitive) of tokens
+            A TokenList (order-sensitive) of tokens, use TokenList.srcs()
+            if only the src of tokens is needed.
 
         """
 
-        level = 0
-        node_lst = []
-        cursor = self.internal.walk()
-        while True:
-            # only append leaf nodes
-            if not cursor.node.children:
-                node_lst.append(self.make_wrapper(cursor.node))
-
-            if not cursor.goto_first_child():
-                while not cursor.goto_next_sibling():
-                    if not cursor.goto_parent():
-                        return node_lst
-                    else:
-                        level -= 1
-            else:
-                level += 1
+        # only collect leaf nodes
+        return TokenList(self, [
+            _n for _n, _ in self._walk_raw(with_root=True)
+            if _n.child_count == 0
+        ])
 
     def print_tree(self):
         """
         Print the parsed tree
         """
 
-        def _tree_nodes():
-            level = 0
-            node_lst = []
-            cursor = self.internal.walk()
-            while True:
-                node_lst.append((self.make_wrapper(cursor.node), level))
-                if not cursor.goto_first_child():
-                    while not cursor.goto_next_sibling():
-                        if not cursor.goto_parent():
-                            return node_lst
-                        else:
-                            level -= 1
-                else:
-                    level += 1
-
-        nlst = _tree_nodes()
+        nlst = [(self.make_wrapper(_n), _l)
+                for _n, _l in self._walk_raw(with_root=True)]
         for _n in nlst:
             node, level = _n
             # prepare the format
@@ -300,12 +647,46 @@ class TypeNode(BasicNode):
     """
     TODO: remove the pointer_level and array_level, use analysis
     module to conclude the related property.
+
+    Attributes:
+        pointer_level (int): the number of pointer declarators applied to
+            the type, e.g., 2 for int **p.
+        array_level (int): the number of array declarators applied to the
+            type, e.g., 1 for int *p[].
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.pointer_level = 0
-        self.array_level = 0
+    __slots__ = ('_lazy__levels',)
+
+    @lazy_property
+    def _levels(self) -> tuple:
+        """
+        (pointer_level, array_level) counted in one walk down the (first)
+        declarator that shares the parent with the type. The walk stops at
+        the function declarators, whose pointers are not of the type.
+        """
+
+        pointer_level = array_level = 0
+        parent = self.internal.parent
+        declarator = parent.child_by_field_name(_F_DECLARATOR) \
+            if parent is not None else None
+        while declarator is not None:
+            kind = declarator.type
+            if kind in _POINTER_DECLARATOR_TYPES:
+                pointer_level += 1
+            elif kind in _ARRAY_DECLARATOR_TYPES:
+                array_level += 1
+            elif kind != 'init_declarator':
+                break
+            declarator = declarator.child_by_field_name(_F_DECLARATOR)
+        return pointer_level, array_level
+
+    @property
+    def pointer_level(self) -> int:
+        return self._levels[0]
+
+    @property
+    def array_level(self) -> int:
+        return self._levels[1]
 
     def is_pointer(self):
         return self.pointer_level != 0
@@ -317,45 +698,66 @@ class TypeNode(BasicNode):
 class TypeIdentifierNode(BasicNode):
     """ Wrapper for type_identifier node in tree-sitter
     """
-    pass
+    __slots__ = ()
 
 
 class FieldIdentifierNode(BasicNode):
     """ Wrapper for field_identifier node in tree-sitter
     """
-    pass
+    __slots__ = ()
 
 
 class FieldDeclarationListNode(BasicNode):
     """ Wrapper for field_declaration_list node in tree-sitter
 
-    One can get all field_declaration by children()
+    One can get all field_declaration by children, or lazily by
+    iter_field_declarations()
     """
-    pass
+    __slots__ = ()
+
+    def iter_field_declarations(self):
+        """
+        Lazily iterate the field_declaration children, the other children
+        (e.g., comments and preprocessor directives) are not wrapped.
+        """
+
+        ids = Util.kind_ids(_FIELD_DECLARATION_TYPES)
+        for _ch in self.internal.children:
+            if _ch.kind_id in ids:
+                yield self.make_wrapper(_ch)
 
 
 class FieldDeclarationNode(BasicNode):
     """ Wrapper for field_declaration node in tree-sitter
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.type: BasicNode = self.child_by_field_name('type')
+    __slots__ = ('_lazy_type', '_lazy_declarator',
+                 '_lazy__declared_identifiers')
+
+    @lazy_property
+    def type(self) -> BasicNode:
+        return self.child_by_field_name('type')
+
+    @lazy_property
+    def declarator(self) -> Optional[BasicNode]:
         # declarator is None for the field declaration of anonymous struct
-        self.declarator: Optional[BasicNode] = self.child_by_field_name(
-            'declarator')
+        return self.child_by_field_name('declarator')
 
 
 class StructSpecifierNode(BasicNode):
     """ Wrapper for struct_specifier node in Tree-sitter
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
+    __slots__ = ('_lazy_name', '_lazy_body')
+
+    @lazy_property
+    def name(self) -> Optional[TypeIdentifierNode]:
         # name may be None for anaonymous struct
-        self.name: Optional[TypeIdentifierNode] = self.child_by_field_name(
-            'name')
-        self.body: FieldDeclarationListNode = self.child_by_field_name('body')
+        return self.child_by_field_name('name')
+
+    @lazy_property
+    def body(self) -> FieldDeclarationListNode:
+        return self.child_by_field_name('body')
 
     def _type_identifier_result(self) -> Optional[str]:
         return self.name.src if self.name else None
@@ -371,7 +773,7 @@ class TypeQualifierNode(BasicNode):
     standard C: const (C89), volatile (C89), restrict (C99)
     and _Atomic (C11)
     """
-    pass
+    __slots__ = ()
 
 
 class StorageClassSpecifierNode(BasicNode):
@@ -386,178 +788,243 @@ class StorageClassSpecifierNode(BasicNode):
     static, and register.
     """
 
-    pass
+    __slots__ = ()
 
 
 class WhileStatementNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.condition = self.child_by_field_name('condition')
-        if self.children:
-            self.body = self.children[-1]
-        else:
-            self.body = None
+    __slots__ = ('_lazy_condition', '_lazy_body')
+
+    @lazy_property
+    def condition(self):
+        return self.child_by_field_name('condition')
+
+    @lazy_property
+    def body(self):
+        return self._nth_child(-1)
 
 
 class IdentifierNode(BasicNode):
 
+    __slots__ = ()
+
     def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
         super().__init__(src, ts_node, ts_tree)
 
-    def __eq__(self, obj):
-        return super().__eq__(obj)
 
-    def __hash__(self):
-        return super().__hash__()
+class CaseExpressionNode(BasicNode):
 
+    __slots__ = ('_lazy_type', '_lazy_value')
 
-class CaseExpressionNode(BasicNode):
+    @lazy_property
+    def type(self):
+        return self.child_by_field_name('type')
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.type = self.child_by_field_name('type')
-        self.value = self.child_by_field_name('value')
+    @lazy_property
+    def value(self):
+        return self.child_by_field_name('value')
 
 
 class UnaryExpressionNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.argument = self.child_by_field_name('argument')
+    __slots__ = ('_lazy_argument',)
+
+    @lazy_property
+    def argument(self):
+        return self.child_by_field_name('argument')
 
     def used_ids(self):
-        ids = self.descendants_by_type_name('identifier')
+        ids = self.descendants_by_type_name('identifier', _NO_IDENTIFIER_TYPES)
         return ids
 
 
 class ConditionalExpressionNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.condition = self.child_by_field_name('condition')
-        self.consequence = self.child_by_field_name('consequence')
-        self.alternative = self.child_by_field_name('alternative')
+    __slots__ = ('_lazy_condition', '_lazy_consequence', '_lazy_alternative')
+
+    @lazy_property
+    def condition(self):
+        return self.child_by_field_name('condition')
+
+    @lazy_property
+    def consequence(self):
+        return self.child_by_field_name('consequence')
+
+    @lazy_property
+    def alternative(self):
+        return self.child_by_field_name('alternative')
 
 
 class NumberLiteralNode(BasicNode):
 
-    pass
+    __slots__ = ()
 
 
 class ReturnStatementNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.value = self.children[1] if len(self.children) > 1 else None
+    __slots__ = ('_lazy_value',)
+
+    @lazy_property
+    def value(self):
+        return self._nth_child(1)
 
 
 class PreprocFunctionDefNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.name = self.child_by_field_name('name')
-        self.parameters = self.child_by_field_name('parameters')
-        self.value = self.child_by_field_name('value')
+    __slots__ = ('_lazy_name', '_lazy_parameters', '_lazy_value')
+
+    @lazy_property
+    def name(self):
+        return self.child_by_field_name('name')
+
+    @lazy_property
+    def parameters(self):
+        return self.child_by_field_name('parameters')
+
+    @lazy_property
+    def value(self):
+        return self.child_by_field_name('value')
 
 
 class ForStatementNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.initializer = self.child_by_field_name('initializer')
-        self.condition = self.child_by_field_name('condition')
-        self.update = self.child_by_field_name('update')
-        if self.children:
-            self.body = self.children[-1]
-        else:
-            self.body = None
+    __slots__ = ('_lazy_initializer', '_lazy_condition', '_lazy_update',
+                 '_lazy_body')
+
+    @lazy_property
+    def initializer(self):
+        return self.child_by_field_name('initializer')
+
+    @lazy_property
+    def condition(self):
+        return self.child_by_field_name('condition')
+
+    @lazy_property
+    def update(self):
+        return self.child_by_field_name('update')
+
+    @lazy_property
+    def body(self):
+        return self._nth_child(-1)
 
 
 class BinaryExpressionNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.left = self.child_by_field_name('left')
-        self.right = self.child_by_field_name('right')
-        self.symbol = self.get_raw(self.internal_src, self.left.end_point,
-                                   self.right.start_point)
-        if self.symbol:
-            self.symbol = self.symbol.strip()
+    __slots__ = ('_lazy_left', '_lazy_right', '_lazy_symbol')
+
+    @lazy_property
+    def left(self):
+        return self.child_by_field_name('left')
+
+    @lazy_property
+    def right(self):
+        return self.child_by_field_name('right')
+
+    @lazy_property
+    def symbol(self) -> str:
+        symbol_start = self.left.internal.end_byte
+        symbol_end = self.right.internal.start_byte
+        return self.internal_src_bytes[symbol_start:symbol_end].decode(
+            'utf8').strip()
 
     def is_logic_op(self):
-        if self.symbol in ['&&', '||']:
+        if self.symbol in {'&&', '||'}:
             return True
         return False
 
 
 class DeclarationNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        # TODO: duplicate name, comment temporarily
-        # self.type = self.child_by_field_name('type')
+    __slots__ = ('_lazy_type', '_lazy__declarators',
+                 '_lazy__declared_identifiers')
+
+    @lazy_property
+    def type(self):
+        return self.child_by_field_name('type')
 
+    @property
+    def declarator(self) -> List[BasicNode]:
+        # a copy, the caller may modify the returned list
+        return list(self._declarators)
+
+    @lazy_property
+    def _declarators(self) -> List[BasicNode]:
         # a tricky solution since tree-sitter child_by_field_name
         # can only return the first field
         # for example, int a,b; returns a.
-        self.type = self.child_by_field_name('type')
-        self.declarator = []
-        for _c in self.children:
-            if _c.node_type in [
-                    'pointer_declarator',
-                    'array_declarator',
-                    'identifier',
-                    'init_declarator',
-                    'function_declarator',
-            ]:
-                self.declarator.append(_c)
+        return self.children_by_type_name(_DECLARATOR_TYPES)
 
     def declared_identifiers(self) -> List[IdentifierNode]:
+        # a copy, the caller may modify the returned list
+        return list(self._declared_identifiers)
+
+    @lazy_property
+    def _declared_identifiers(self) -> List[IdentifierNode]:
+        # inner property
         ids = []
-        for _decl in self.declarator:
-            unpack_type = [
-                'pointer_declarator',
-                'array_declarator',
-                'init_declarator',
-                'function_declarator',
-            ]
-            while _decl.node_type in unpack_type:
-                _decl = _decl.child_by_field_name('declarator')
-            assert (_decl.node_type == 'identifier')
-            ids.append(_decl)
+        for _decl in self._declarators:
+            ts_decl = _decl.internal
+            while ts_decl.type in _DECLARATOR_UNPACK:
+                ts_decl = ts_decl.child_by_field_name(_F_DECLARATOR)
+            assert (ts_decl.type == 'identifier')
+            ids.append(self.make_wrapper(ts_decl))
         return ids
 
 
 class DoStatementNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.body = self.child_by_field_name('body')
-        self.condition = self.child_by_field_name('condition')
+    __slots__ = ('_lazy_body', '_lazy_condition')
+
+    @lazy_property
+    def body(self):
+        return self.child_by_field_name('body')
+
+    @lazy_property
+    def condition(self):
+        return self.child_by_field_name('condition')
 
 
 class ParenthesizedExpressionNode(BasicNode):
 
+    __slots__ = ()
+
     def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
         super().__init__(src, ts_node, ts_tree)
 
     def remove_parenthese(self):
-        # children[0] and children[2] is ( and )
-        return self.make_wrapper(self.internal.children[1])
+        # the only named child besides the extras (i.e., comments), picked
+        # by index without wrapping or listing all the children
+        internal = self.internal
+        for _i in range(internal.named_child_count):
+            child = internal.named_child(_i)
+            if not child.is_extra:
+                return self.make_wrapper(child)
+        return None
 
 
 class IfStatementNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
+    __slots__ = ('_lazy_condition', '_lazy_condition_abs', '_lazy_consequence',
+                 '_lazy_alternative')
+
+    @lazy_property
+    def condition(self):
+        return self.child_by_field_name('condition')
+
+    @lazy_property
+    def condition_abs(self):
         from .abstract_node import IfConditionNode
-        super().__init__(src, ts_node, ts_tree)
-        self.condition = self.child_by_field_name('condition')
         # By AbstractNode, we assume there is a node with the type
         # if_condition, which is actually non-exist in tree-sitter.
-        self.condition_abs = IfConditionNode(self.condition)
-        self.consequence = self.child_by_field_name('consequence')
-        self.alternative = self.child_by_field_name('alternative')
+        return IfConditionNode(self.condition)
+
+    @lazy_property
+    def consequence(self):
+        return self.child_by_field_name('consequence')
+
+    @lazy_property
+    def alternative(self):
+        return self.child_by_field_name('alternative')
 
     def common_entry_constraints(self):
         return self.condition_abs.common_entry_constraints()
@@ -566,6 +1033,49 @@ class IfStatementNode(BasicNode):
         return self.condition_abs.entry_constraints()
 
 
+def _field_declarator(ts_node):
+    return ts_node.child_by_field_name(_F_DECLARATOR)
+
+
+def _paren_declarator(ts_node):
+    # the counterpart of BasicNode.children[0]
+    for _ch in ts_node.children:
+        if _ch.type not in _PUNCT_TYPES:
+            return _ch
+    return None
+
+
+# how ParameterDeclarationNode.name steps into the nested declarator, the
+# steps work on tree-sitter nodes and only the result is wrapped
+_PARAM_NAME_STEP = {
+    # int func(int *a)
+    'pointer_declarator': _field_declarator,
+    # int func(int (*a)())
+    'function_declarator': _field_declarator,
+    'parenthesized_declarator': _paren_declarator,
+    # int func(int a[])
+    'array_declarator': _field_declarator,
+}
+
+
+def _param_name_terminal(ts_node):
+    # the name at the declarator that ends the stepping of
+    # ParameterDeclarationNode.name, None for the other declarators, e.g.,
+    # abstract_pointer_declarator in the declaration int func(int *)
+    if ts_node.type == 'identifier':
+        # int func(int a)
+        return ts_node
+    return None
+
+
+# how FunctionDefinitionNode steps into the nested function_declarator
+_FUNC_DECLARATOR_STEP = {
+    'function_declarator': _field_declarator,
+    'parenthesized_declarator': _paren_declarator,
+    'pointer_declarator': _field_declarator,
+}
+
+
 class ParameterDeclarationNode(BasicNode):
     """ The wrapper of the parameter_declaration node in tree-sitter.
 
@@ -576,12 +1086,16 @@ class ParameterDeclarationNode(BasicNode):
             int func(int).
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
+    __slots__ = ('_lazy_type', '_lazy_declarator',
+                 '_lazy__declared_identifiers')
 
-        # fields of the tree-sitter node
-        self.type = self.child_by_field_name('type')
-        self.declarator = self.child_by_field_name('declarator')
+    @lazy_property
+    def type(self):
+        return self.child_by_field_name('type')
+
+    @lazy_property
+    def declarator(self):
+        return self.child_by_field_name('declarator')
 
     @property
     def type_qualifier(self) -> List[TypeQualifierNode]:
@@ -589,7 +1103,7 @@ class ParameterDeclarationNode(BasicNode):
         get the type qualifier of the parameter
         """
 
-        return [_c for _c in self.children if isinstance(_c, TypeQualifierNode)]
+        return self.children_by_type_name('type_qualifier')
 
     @property
     def storage_class_specifier(self) -> List[StorageClassSpecifierNode]:
@@ -597,39 +1111,20 @@ class ParameterDeclarationNode(BasicNode):
         get the storage class specifier of the parameter
         """
 
-        return [
-            _c for _c in self.children
-            if isinstance(_c, StorageClassSpecifierNode)
-        ]
+        return self.children_by_type_name('storage_class_specifier')
 
     @property
     def name(self) -> Optional[IdentifierNode]:
         """
         try to analyse the name of the parameter
         """
-        declarator = self.declarator
-        # self.declarator maybe None, e.g. int func(void)
-        while True and declarator:
-            # int func(int *a)
-            if declarator.node_type == 'pointer_declarator':
-                declarator = declarator.child_by_field_name('declarator')
-            # mainly in declaration such as int func(int *)
-            elif declarator.node_type == 'abstract_pointer_declarator':
-                return None
-            # int func(int (*a)())
-            elif declarator.node_type == 'function_declarator':
-                declarator = declarator.child_by_field_name('declarator')
-            # int func(int (*a)())
-            elif declarator.node_type == 'parenthesized_declarator':
-                declarator = declarator.children[0]
-            # int func(int a[])
-            elif declarator.node_type == 'array_declarator':
-                declarator = declarator.child_by_field_name('declarator')
-            # int func(int a)
-            elif declarator.node_type == 'identifier':
-                return declarator
-            else:
-                assert (False)
+        declarator = self._child_by_field_name_raw(_F_DECLARATOR)
+        # declarator maybe None, e.g. int func(void)
+        while declarator is not None:
+            step = _PARAM_NAME_STEP.get(declarator.type)
+            if step is None:
+                return self.make_wrapper(_param_name_terminal(declarator))
+            declarator = step(declarator)
         return None
 
 
@@ -641,7 +1136,7 @@ class ParameterListNode(BasicNode):
     <children>.
     """
 
-    pass
+    __slots__ = ()
 
 
 class FunctionDeclaratorNode(BasicNode):
@@ -652,11 +1147,15 @@ class FunctionDeclaratorNode(BasicNode):
         parameters (ParameterListNode): parameters
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.declarator: BasicNode = self.child_by_field_name('declarator')
-        self.parameters: ParameterListNode = self.child_by_field_name(
-            'parameters')
+    __slots__ = ('_lazy_declarator', '_lazy_parameters')
+
+    @lazy_property
+    def declarator(self) -> BasicNode:
+        return self.child_by_field_name('declarator')
+
+    @lazy_property
+    def parameters(self) -> ParameterListNode:
+        return self.child_by_field_name('parameters')
 
 
 class FunctionDefinitionNode(BasicNode):
@@ -670,48 +1169,55 @@ class FunctionDefinitionNode(BasicNode):
     TODO: name may be None under some cases
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.type: TypeNode = self.child_by_field_name('type')
-        self.declarator: FunctionDeclaratorNode = self.child_by_field_name(
-            'declarator')
-        self.body: CompoundStatementNode = self.child_by_field_name('body')
+    __slots__ = ('_lazy_type', '_lazy_declarator', '_lazy_body', '_lazy_name',
+                 '_lazy_parameters', '_lazy__storage_class_texts',
+                 '_lazy_static', '_lazy_inline')
+
+    @lazy_property
+    def type(self) -> TypeNode:
+        return self.child_by_field_name('type')
+
+    @lazy_property
+    def declarator(self) -> FunctionDeclaratorNode:
+        return self.child_by_field_name('declarator')
+
+    @lazy_property
+    def body(self) -> 'CompoundStatementNode':
+        return self.child_by_field_name('body')
 
     def _identifier_result(self) -> Optional[str]:
         return self.name.src
 
-    def __get_nest_function_declarator(self) -> FunctionDeclaratorNode:
+    def __get_nest_function_declarator(self):
         """
         function_declarator may be nested, e.g. int (*func(int a))(int b).
-        This function find the innermost one, i.e., func(int a).
+        This function find the innermost one, i.e., func(int a), and returns
+        the unwrapped tree-sitter node.
         """
-        declarator = self.declarator
+        declarator = self._child_by_field_name_raw(_F_DECLARATOR)
         last_function_declarator = declarator
         # try to find out the nest function_declarator
-        while True:
-            if declarator.node_type == 'function_declarator':
+        while declarator is not None and declarator.type != 'identifier':
+            if declarator.type == 'function_declarator':
                 last_function_declarator = declarator
-                declarator = declarator.child_by_field_name('declarator')
-            elif declarator.node_type == 'parenthesized_declarator':
-                declarator = declarator.children[0]
-            elif declarator.node_type == 'pointer_declarator':
-                declarator = declarator.child_by_field_name('declarator')
-            elif declarator.node_type == 'identifier':
+            step = _FUNC_DECLARATOR_STEP.get(declarator.type)
+            if step is None:
+                # the declarators not known to nest a function_declarator
                 break
-            else:
-                assert (0)
+            declarator = step(declarator)
         return last_function_declarator
 
-    @property
+    @lazy_property
     def name(self) -> IdentifierNode:
         """
         conclude the name of the function
         """
 
-        return self.__get_nest_function_declarator().child_by_field_name(
-            'declarator')
+        return self.make_wrapper(
+            self.__get_nest_function_declarator().child_by_field_name(
+                _F_DECLARATOR))
 
-    @property
+    @lazy_property
     def parameters(self) -> ParameterListNode:
         """ conclude the parameters of the function
 
@@ -723,8 +1229,9 @@ class FunctionDefinitionNode(BasicNode):
         is `(int)`, while `int a` is the real parameter of the function.
         """
 
-        return self.__get_nest_function_declarator().child_by_field_name(
-            'parameters')
+        return self.make_wrapper(
+            self.__get_nest_function_declarator().child_by_field_name(
+                _F_PARAMETERS))
 
     @property
     def type_qualifier(self) -> List[TypeQualifierNode]:
@@ -732,7 +1239,8 @@ class FunctionDefinitionNode(BasicNode):
         get the type qualifier of the parameter
         """
 
-        return [_c for _c in self.children if isinstance(_c, TypeQualifierNode)]
+        # a new list, the children are bucketed by type once
+        return self.children_by_type_name('type_qualifier')
 
     @property
     def storage_class_specifier(self) -> List[StorageClassSpecifierNode]:
@@ -740,46 +1248,68 @@ class FunctionDefinitionNode(BasicNode):
         get the storage class specifier of the parameter
         """
 
-        return [
-            _c for _c in self.children
-            if isinstance(_c, StorageClassSpecifierNode)
-        ]
+        return self.children_by_type_name('storage_class_specifier')
 
-    @property
+    @lazy_property
+    def _storage_class_texts(self) -> AbstractSet[bytes]:
+        # collected once for both static and inline, without wrapping or
+        # decoding the children
+        return {
+            _ch.text
+            for _ch in self.internal.children
+            if _ch.type == 'storage_class_specifier'
+        }
+
+    @lazy_property
     def static(self) -> bool:
         """
         Whether the function is static
         """
-        storage_class_specifiers = [_.src for _ in self.children]
-        return True if 'static' in storage_class_specifiers else False
+        return b'static' in self._storage_class_texts
 
-    @property
+    @lazy_property
     def inline(self) -> bool:
         """
         Whether the function is inline
         """
-        storage_class_specifiers = [_.src for _ in self.children]
-        return True if 'inline' in storage_class_specifiers else False
+        return b'inline' in self._storage_class_texts
 
 
 class SubscriptExpressionNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.argument = self.child_by_field_name('argument')
-        self.index = self.child_by_field_name('index')
+    __slots__ = ('_lazy_argument', '_lazy_index')
+
+    @lazy_property
+    def argument(self):
+        return self.child_by_field_name('argument')
+
+    @lazy_property
+    def index(self):
+        return self.child_by_field_name('index')
 
 
 class CallExpressionNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.function = self.child_by_field_name('function')
-        self.arguments = self.child_by_field_name(
-            'arguments').children  # at least ( and ) as children
-        # filter out bracket
-        self.arguments = [
-            _a for _a in self.arguments if _a.src not in ['(', ')']
+    __slots__ = ('_lazy_function', '_lazy__arguments')
+
+    @lazy_property
+    def function(self):
+        return self.child_by_field_name('function')
+
+    @property
+    def arguments(self) -> List[BasicNode]:
+        # a copy, the caller may modify the returned list
+        return list(self._arguments)
+
+    @lazy_property
+    def _arguments(self) -> List[BasicNode]:
+        arguments = self._child_by_field_name_raw(
+            'arguments')  # at least ( and ) as children
+        # filter out bracket and comma before wrapping
+        return [
+            self.make_wrapper(_ch)
+            for _ch in arguments.children
+            if _ch.type not in _PUNCT_TYPES
         ]
 
     def is_indirect(self) -> bool:
@@ -790,17 +1320,22 @@ class CallExpressionNode(BasicNode):
 
 class ExpressionStatementNode(BasicNode):
 
-    pass
+    __slots__ = ()
 
 
 class AssignmentExpressionNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.left = self.child_by_field_name('left')
-        self.right = self.child_by_field_name('right')
+    __slots__ = ('_lazy_left', '_lazy_right', '_lazy_symbol')
 
-    @property
+    @lazy_property
+    def left(self):
+        return self.child_by_field_name('left')
+
+    @lazy_property
+    def right(self):
+        return self.child_by_field_name('right')
+
+    @lazy_property
     def symbol(self) -> str:
         """
         Return the symbol of the assignment expression, e.g.,
@@ -809,32 +1344,45 @@ class AssignmentExpressionNode(BasicNode):
 
         symbol_start = self.left.internal.end_byte
         symbol_end = self.right.internal.start_byte
-        return self.internal_src[symbol_start + 1:symbol_end].strip()
+        return self.internal_src_bytes[symbol_start:symbol_end].decode(
+            'utf8').strip()
 
 
 class InitDeclaratorNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.declarator = self.child_by_field_name('declarator')
-        self.value = self.child_by_field_name('value')
+    __slots__ = ('_lazy_declarator', '_lazy_value')
+
+    @lazy_property
+    def declarator(self):
+        return self.child_by_field_name('declarator')
+
+    @lazy_property
+    def value(self):
+        return self.child_by_field_name('value')
 
 
 class PreprocArgNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
+    __slots__ = ()
+
+    @lazy_property
+    def src(self) -> str:
         # Tree-sitter parser will include the useless spaces
         # in preproc_arg, thus we do strip() for src.
-        self.src = self.src.strip()
+        return self.src_bytes.decode("utf8").strip()
 
 
 class PreprocDefNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.name = self.child_by_field_name('name')
-        self.value = self.child_by_field_name('value')
+    __slots__ = ('_lazy_name', '_lazy_value')
+
+    @lazy_property
+    def name(self):
+        return self.child_by_field_name('name')
+
+    @lazy_property
+    def value(self):
+        return self.child_by_field_name('value')
 
     def __str__(self):
         return f'#define {self.name} {self.value}'
@@ -855,13 +1403,25 @@ class EnumSpecifierNode(BasicNode):
 
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.name: Optional[TypeIdentifierNode] = self.child_by_field_name(
-            'name')
+    __slots__ = ('_lazy_name', '_lazy__body', '_lazy__kv')
+
+    @lazy_property
+    def name(self) -> Optional[TypeIdentifierNode]:
+        return self.child_by_field_name('name')
+
+    @lazy_property
+    def _body(self) -> 'EnumeratorListNode':
         # inner property
-        self._body: EnumeratorListNode = self.child_by_field_name('body')
-        self.kv: dict = self._body.kv if self._body else dict()
+        return self.child_by_field_name('body')
+
+    @property
+    def kv(self) -> dict:
+        # a copy, the caller may modify the returned dict
+        return dict(self._kv)
+
+    @lazy_property
+    def _kv(self) -> dict:
+        return self._body._kv if self._body else dict()
 
     def _type_identifier_result(self) -> Optional[str]:
         return self.name.src if self.name else None
@@ -874,12 +1434,12 @@ class EnumSpecifierNode(BasicNode):
         to perform conclude_value.
         """
         lst = []
-        for _k, _v in self.kv.items():
+        for _k, _v in self._kv.items():
             if _v and not isinstance(_v, NumberLiteralNode):
                 lst.append(_v)
         return lst
 
-    def conclude_value(self, value_dic=dict()) -> dict:
+    def conclude_value(self, value_dic: Optional[dict] = None) -> dict:
         """
         While self.kv provides the literal enum key and
         value, conclude_value tries to conclude the actual
@@ -898,37 +1458,39 @@ class EnumSpecifierNode(BasicNode):
         dict like {A1: 1, A2: 2}.
         """
 
+        if not value_dic:
+            # no symbol can be resolved, and self.kv is collected in the
+            # source order, thus each value is either its number literal or
+            # the previous value plus one
+            ret: Dict[BasicNode, Optional[int]] = dict()
+            pre_ele: Optional[int] = -1
+            for _k, _v in self._kv.items():
+                if _v is None:
+                    pre_ele = pre_ele + 1 if pre_ele is not None else None
+                elif isinstance(_v, NumberLiteralNode):
+                    pre_ele = int(str(_v))
+                else:
+                    pre_ele = None
+                ret[_k] = pre_ele
+            return ret
+
         def solve(val) -> Optional[int]:
             # the types of the values of the output dic are int and None
             if isinstance(val, NumberLiteralNode):
                 return int(str(val))
-            elif val in value_dic.keys():
+            elif val in value_dic:
                 return int(value_dic[val])
             else:
                 return None
 
         # 1. conclude the value of each item
-        # 1.1 sort the items
-        k_lst: List[BasicNode] = []
-        for _k in self.kv.keys():
-            if not k_lst:
-                k_lst.append(_k)
-                continue
-
-            insert_idx = -1
-            for _id, _ in enumerate(k_lst):
-                if not _.in_front(_k):
-                    insert_idx = _id
-                    break
-            # when _k is behind all elements in k_lst
-            if insert_idx == -1:
-                insert_idx = len(k_lst)
-            k_lst.insert(insert_idx, _k)
+        # 1.1 sort the items by their position
+        k_lst: List[BasicNode] = Util.sort_nodes(self._kv.keys())
 
         # 1.2 conclude the value
         dic: Dict[BasicNode, Optional[int]] = dict()
         for _id, _k in enumerate(k_lst):
-            _v = self.kv[_k]
+            _v = self._kv[_k]
             if _id == 0 and _v is None:
                 _v = 0
             elif _v is not None:
@@ -936,7 +1498,7 @@ class EnumSpecifierNode(BasicNode):
             # query the previous element
             elif _v is None:
                 pre_ele = dic[k_lst[_id - 1]]
-                _v = pre_ele + 1 if type(pre_ele) == int else None
+                _v = pre_ele + 1 if isinstance(pre_ele, int) else None
             else:
                 assert (False)
             dic[_k] = _v
@@ -945,25 +1507,51 @@ class EnumSpecifierNode(BasicNode):
 
 class EnumeratorListNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.enumerator = self.descendants_by_type_name('enumerator')
-        self.kv = dict()
-        for _e in self.enumerator:
-            self.kv[_e.name] = _e.value
+    __slots__ = ('_lazy__kv',)
+
+    @property
+    def kv(self) -> dict:
+        # a copy, the caller may modify the returned dict
+        return dict(self._kv)
+
+    @lazy_property
+    def _kv(self) -> dict:
+        kv = dict()
+        # read the fields of enumerators directly instead of wrapping them
+        cursor = self.internal.walk()
+        while True:
+            _n = cursor.node
+            if _n.type == 'enumerator':
+                _name = self.make_wrapper(_n.child_by_field_name(_F_NAME))
+                kv[_name] = self.make_wrapper(_n.child_by_field_name(_F_VALUE))
+            # enumerators may be nested in preprocessor directives
+            if _n.type == 'enumerator' or not cursor.goto_first_child():
+                while not cursor.goto_next_sibling():
+                    if not cursor.goto_parent():
+                        return kv
+
+    @property
+    def enumerator(self) -> List['EnumeratorNode']:
+        # enumerators don't nest
+        return self.descendants_by_type_name('enumerator', {'enumerator'})
 
 
 class EnumeratorNode(BasicNode):
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.name = self.child_by_field_name('name')
-        self.value = self.child_by_field_name('value')
+    __slots__ = ('_lazy_name', '_lazy_value')
+
+    @lazy_property
+    def name(self):
+        return self.child_by_field_name('name')
+
+    @lazy_property
+    def value(self):
+        return self.child_by_field_name('value')
 
 
 class VariadicParameterNode(BasicNode):
 
-    pass
+    __slots__ = ()
 
 
 class CompoundStatementNode(BasicNode):
@@ -978,6 +1566,56 @@ class CompoundStatementNode(BasicNode):
 
     """
 
-    def __init__(self, src: str, ts_node=None, ts_tree=None) -> None:
-        super().__init__(src, ts_node, ts_tree)
-        self.statements = self.children
+    __slots__ = ()
+
+    @property
+    def statements(self) -> List[BasicNode]:
+        return self.children
+
+
+# the wrapper classes of tree-sitter nodes, used by BasicNode.make_wrapper
+# kind id -> the wrapper class, filled from _WRAPPER_DICT on demand
+_WRAPPERS_BY_KIND: Dict[int, type] = dict()
+
+_WRAPPER_DICT = {
+    'assignment_expression': AssignmentExpressionNode,
+    'binary_expression': BinaryExpressionNode,
+    'call_expression': CallExpressionNode,
+    'cast_expression': CaseExpressionNode,
+    'conditional_expression': ConditionalExpressionNode,
+    'compound_statement': CompoundStatementNode,
+    'declaration': DeclarationNode,
+    'do_statement': DoStatementNode,
+    'enum_specifier': EnumSpecifierNode,
+    'enumerator_list': EnumeratorListNode,
+    'enumerator': EnumeratorNode,
+    'expression_statement': ExpressionStatementNode,
+    'field_identifier': FieldIdentifierNode,
+    'field_declaration_list': FieldDeclarationListNode,
+    'field_declaration': FieldDeclarationNode,
+    'function_definition': FunctionDefinitionNode,
+    'function_declarator': FunctionDeclaratorNode,
+    'for_statement': ForStatementNode,
+    'if_statement': IfStatementNode,
+    'init_declarator': InitDeclaratorNode,
+    'identifier': IdentifierNode,
+    'primitive_type': TypeNode,
+    'number_literal': NumberLiteralNode,
+    'parenthesized_expression': ParenthesizedExpressionNode,
+    'preproc_function_def': PreprocFunctionDefNode,
+    'preproc_def': PreprocDefNode,
+    'preproc_arg': PreprocArgNode,
+    'parameter_declaration': ParameterDeclarationNode,
+    'parameter_list': ParameterListNode,
+    'return_statement': ReturnStatementNode,
+    'struct_specifier': StructSpecifierNode,
+    'subscript_expression': SubscriptExpressionNode,
+    'storage_class_specifier': StorageClassSpecifierNode,
+    'sized_type_specifier': TypeNode,
+    'macro_type_specifier': TypeNode,
+    'type_qualifier': TypeQualifierNode,
+    'type_identifier': TypeIdentifierNode,
+    'unary_expression': UnaryExpressionNode,
+    'variadic_parameter': VariadicParameterNode,
+    'while_statement': WhileStatementNode,
+}
@@ -3,6 +3,7 @@ Edit nodes
 """
 
 from __future__ import annotations
+from operator import attrgetter
 from typing import Tuple, List, Optional
 from .basic_node import BasicNode
 from .node import Util
@@ -10,6 +11,8 @@ from .node import Util
 
 class EditPos:
 
+    __slots__ = ('start', 'end', 'new_snippet')
+
     def __init__(self, start: int, end: int, new_snippet: str) -> None:
         self.start = start
         self.end = end
@@ -18,27 +21,43 @@ class EditPos:
 
 def edit_str(s: str, edits: List[EditPos]) -> Optional[str]:
 
-    edits = sorted(edits, key=lambda x: x.start)
-
-    for i in range(len(edits)):
+    edits = sorted(edits, key=attrgetter('start'))
 
-        # check whether there is overlap in the edits
-        if i != len(edits) - 1 and edits[i].end > edits[i + 1].start:
+    # single pass: check the edits while joining the untouched segments and
+    # the new snippets
+    segments = []
+    prev = 0
+    for edit in edits:
+        # the edit starts before the end of the previous one (overlap), or it
+        # is not within the string
+        if edit.start < prev or edit.end > len(s):
             return None
+        segments.append(s[prev:edit.start])
+        segments.append(edit.new_snippet)
+        prev = edit.end
+    segments.append(s[prev:])
 
-        # check whether the start and end are within the string
-        if edits[i].start < 0 or edits[i].end > len(s):
-            return None
+    return ''.join(segments)
 
-    # start replacing
-    s_lst = list(s)
-    gap_cnt = 0
-    for edit in edits:
-        s_lst[edit.start + gap_cnt:edit.end + gap_cnt] = list(edit.new_snippet)
-        gap = len(edit.new_snippet) - (edit.end - edit.start)
-        gap_cnt += gap
 
-    return ''.join(s_lst)
+def _find_by_type_and_byte(cursor, type_name: str, start_byte: int):
+    """
+    Find the outermost descendant of the cursor's node that starts at
+    start_byte and is of type_name. Only the nodes covering start_byte are
+    visited, the raw tree-sitter node is returned, or None if not found.
+    """
+
+    while cursor.goto_first_child():
+        # move to the child covering start_byte
+        while cursor.node.end_byte <= start_byte \
+                and cursor.goto_next_sibling():
+            pass
+        ts_node = cursor.node
+        if not ts_node.start_byte <= start_byte < ts_node.end_byte:
+            return None
+        if ts_node.start_byte == start_byte and ts_node.type == type_name:
+            return ts_node
+    return None
 
 
 class Edit(Util):
@@ -49,6 +68,8 @@ class Edit(Util):
 
     """
 
+    __slots__ = ('target',)
+
     def __init__(self, target: BasicNode):
         self.target: BasicNode = target
 
@@ -77,15 +98,17 @@ class Edit(Util):
         return is_infront(self.target.start_point, child.start_point) \
             and is_infront(child.end_point, self.target.end_point)
 
-    def _remove_child_src(self, child: BasicNode) -> str:
+    def _remove_child_src(self, child: BasicNode) -> bytes:
         """
         remove child's source code from self.target.internal_src
 
         Returns:
-            the new source code
+            the new source code, utf-8 encoded
         """
 
-        internal_src = self.target.internal_src
+        # tree-sitter offsets are byte offsets, slice the bytes rather than
+        # the str for non-ASCII sources
+        internal_src = self.target.internal_src_bytes
         start_byte = child.internal.start_byte
         end_byte = child.internal.end_byte
         return internal_src[:start_byte] + internal_src[end_byte:]
@@ -101,8 +124,15 @@ class Edit(Util):
         assert (self.is_child(child))
 
         # remove the child from the children list
-        new_src = self._remove_child_src(child)
+        new_src_bytes = self._remove_child_src(child)
+        parser = self.get_parser()
         tree = self.target.internal_tree
+        if self.target._tree_cache.shared or self._is_cached_tree(tree):
+            # the tree is shared by other CCode of the same source (see
+            # Util.get_tree), while tree_sitter.Tree.edit modifies the tree
+            # in place and tree_sitter.Tree has no copy(). A private tree of
+            # the same source is parsed for editing instead.
+            tree = parser.parse(self.target.internal_src_bytes)
         tree.edit(
             start_byte=child.internal.start_byte,
             old_end_byte=child.internal.end_byte,
@@ -111,21 +141,20 @@ class Edit(Util):
             old_end_point=child.internal.end_point,
             new_end_point=child.internal.start_point,
         )
-        parser = self.get_parser()
-        new_tree = parser.parse(bytes(new_src, 'utf8'), tree)
+        new_tree = parser.parse(new_src_bytes, tree)
         """
         relocate to the target node, since we delete the child
-        of self.target, the start_point of self.target should
-        be unchanged.
+        of self.target, the start of self.target should be unchanged.
+        Only the nodes covering the start are visited from the root.
         """
-        old_start_point = self.target.start_point
+        old_start_byte = self.target.internal.start_byte
         node_type = self.target.node_type
-        # construct the BasicNode
+        found = _find_by_type_and_byte(new_tree.walk(), node_type,
+                                       old_start_byte)
+        # the root wrapper only serves to wrap the found node, no other
+        # node of the new tree is wrapped
+        new_src = new_src_bytes.decode('utf8')
         bn = BasicNode(new_src, new_tree.root_node, new_tree)
-        target = None
-        for _ in bn.descendants_by_type_name(node_type):
-            if _.start_point == old_start_point:
-                target = _
-                break
+        target = bn.make_wrapper(found)
         assert (target is not None)
         return target
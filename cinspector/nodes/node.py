@@ -4,12 +4,70 @@ Make a wrapper of tree-sitter node
 
 from __future__ import annotations
 import os
-from functools import cmp_to_key
-from typing import Dict, Optional, Iterable, TYPE_CHECKING
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import accumulate
+from operator import attrgetter
+from typing import Dict, List, Optional, Iterable, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from .basic_node import BasicNode
 from tree_sitter import Language, Parser
 
+# the grammar built by _gen_parser.py, its location is fixed once imported
+_SO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                        'cinspector-tree-sitter.so')
+
+# the language is loaded once, and every thread reuses its own parser since
+# tree_sitter.Parser is not thread-safe
+_C_LANGUAGE: Optional[Language] = None
+_LANGUAGE_LOCK = threading.Lock()
+_PARSERS = threading.local()
+
+# node type name -> the ids of the node kinds with that name, several kinds
+# may share one name (e.g., the aliased ones)
+_KIND_IDS: Dict[str, frozenset] = dict()
+
+# the ids of the constant type name sets, e.g., the skipped types of traversals
+_KIND_ID_SETS: Dict[frozenset, frozenset] = dict()
+
+# the kind id of ERROR nodes, ts_builtin_sym_error of tree-sitter
+_ERROR_KIND_ID = 0xFFFF
+
+# node kind id -> the interned node type name
+_KIND_NAMES: List[str] = []
+
+# the recently parsed trees keyed by the source code, Util.get_tree returns the
+# cached tree for the same source instead of parsing it again
+_TREES: OrderedDict = OrderedDict()
+_TREES_MAXSIZE = 16
+_TREES_LOCK = threading.Lock()
+
+
+class lazy_property:
+    """ Decorator of the property that is computed on the first access
+
+    The wrappers have no instance __dict__, so the computed value is stored
+    into the slot named _lazy_<name>, which must be declared in the
+    __slots__ of the owner class.
+    """
+
+    def __init__(self, func) -> None:
+        self.func = func
+        self.slot = '_lazy_' + func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            value = self.func(obj)
+            setattr(obj, self.slot, value)
+            return value
+
 
 class Util():
     """
@@ -17,28 +75,138 @@ class Util():
     Methods:
         sort_nodes(nodes: Iterable, reverse: bool = False): sort the nodes by
             their position in internal_src.
+        get_tree(src: str, src_bytes: Optional[bytes] = None): parse src,
+            the recently parsed trees are reused.
+        kind_ids(type_names: Iterable[str]): the ids of the node kinds named
+            by type_names.
+        kind_name(kind_id: int): the type name of the node kind kind_id.
     """
 
+    __slots__ = ()
+
+    @staticmethod
+    def _get_language() -> Language:
+        global _C_LANGUAGE, _KIND_IDS, _KIND_NAMES
+        if _C_LANGUAGE is not None:
+            return _C_LANGUAGE
+        with _LANGUAGE_LOCK:
+            # another thread may have loaded it while this one was waiting
+            if _C_LANGUAGE is not None:
+                return _C_LANGUAGE
+            language = Language(_SO_PATH, 'c')
+            kind_ids: Dict[str, set] = dict()
+            kind_names: List[str] = []
+            # the stubs of tree-sitter 0.20 miss the node kind accessors
+            kind_count = language.node_kind_count  # type: ignore
+            for _id in range(kind_count):
+                _name = sys.intern(
+                    language.node_kind_for_id(_id))  # type: ignore
+                kind_ids.setdefault(_name, set()).add(_id)
+                kind_names.append(_name)
+            # ERROR nodes are of a builtin kind out of the table
+            kind_ids.setdefault('ERROR', set()).add(_ERROR_KIND_ID)
+            # the finished tables are published before the language, which
+            # the other threads check without the lock
+            _KIND_IDS = {_k: frozenset(_v) for _k, _v in kind_ids.items()}
+            _KIND_NAMES = kind_names
+            _C_LANGUAGE = language
+        return _C_LANGUAGE
+
+    @staticmethod
+    def kind_name(kind_id: int) -> str:
+        """ the interned type name of the node kind kind_id
+
+        The ids out of the table of the language, i.e., the builtin kind
+        of ERROR nodes, are named by tree-sitter.
+        """
+
+        language = Util._get_language()
+        if kind_id < len(_KIND_NAMES):
+            return _KIND_NAMES[kind_id]
+        return sys.intern(language.node_kind_for_id(kind_id))  # type: ignore
+
+    @staticmethod
+    def kind_ids(type_names: Iterable[str]) -> frozenset:
+        """ the ids of the node kinds named by type_names
+
+        Comparing tree_sitter.Node.kind_id with the ids is cheaper than
+        comparing tree_sitter.Node.type, which creates a str on every access.
+        The ids of a frozenset of names are kept for the following calls.
+        """
+
+        Util._get_language()
+        if isinstance(type_names, frozenset):
+            cached = _KIND_ID_SETS.get(type_names)
+            if cached is not None:
+                return cached
+        ids: frozenset = frozenset()
+        for _name in type_names:
+            ids = ids.union(_KIND_IDS.get(_name, ()))
+        if isinstance(type_names, frozenset):
+            _KIND_ID_SETS[type_names] = ids
+        return ids
+
     def get_parser(self):
-        abs_path = os.path.abspath(__file__)
-        dire = os.path.dirname(abs_path)
-        C_LANGUAGE = Language(f'{dire}/../cinspector-tree-sitter.so', 'c')
-        parser = Parser()
-        parser.set_language(C_LANGUAGE)
+        parser = getattr(_PARSERS, 'parser', None)
+        if parser is None:
+            parser = Parser()
+            parser.set_language(Util._get_language())
+            _PARSERS.parser = parser
         return parser
 
-    def get_tree(self, src: str):
+    def get_tree(self, src: str, src_bytes: Optional[bytes] = None):
+        """ Parse src, the recently parsed trees are reused
+
+        Args:
+            src (str): the source code
+            src_bytes (Optional[bytes]): src encoded in utf-8, pass it if the
+                caller has already encoded src to avoid encoding it again.
+                The tree keeps the bytes as tree.text.
+        """
+
+        with _TREES_LOCK:
+            tree = _TREES.get(src)
+            if tree is not None:
+                _TREES.move_to_end(src)
+                return tree
+        if src_bytes is None:
+            src_bytes = src.encode('utf8')
         parser = self.get_parser()
-        tree = parser.parse(bytes(src, 'utf8'))
+        return Util._remember_tree(src, parser.parse(src_bytes))
+
+    @staticmethod
+    def _remember_tree(src: str, tree):
+        """ Cache tree as the tree of src for get_tree
+
+        The tree already cached for src wins and is returned. The cached
+        tree is shared by the callers of get_tree, thus it must not be edited
+        afterwards.
+        """
+
+        with _TREES_LOCK:
+            tree = _TREES.setdefault(src, tree)
+            _TREES.move_to_end(src)
+            if len(_TREES) > _TREES_MAXSIZE:
+                _TREES.popitem(last=False)
         return tree
 
+    @staticmethod
+    def _is_cached_tree(tree) -> bool:
+        """
+        Whether tree is served by get_tree, such a tree is shared by all the
+        callers of get_tree and must never be edited in place.
+        """
+
+        with _TREES_LOCK:
+            return any(_t is tree for _t in _TREES.values())
+
     def get_cursor(self, src: str):
         parser = self.get_parser()
         tree = parser.parse(bytes(src, 'utf8'))
         return tree.walk()
 
     @staticmethod
-    def sort_nodes(nodes: Iterable, reverse: bool = False) -> Iterable:
+    def sort_nodes(nodes: Iterable, reverse: bool = False) -> list:
         """ Sort the instances of BasicNode by their position in source code
 
         Args:
@@ -46,18 +214,13 @@ class Util():
             reverse (bool=False): use descending instead of ascending
 
         Return:
-            sorted Iterable object
+            the sorted list
         """
 
-        def cmp_position(node1: BasicNode, node2: BasicNode) -> int:
-            if node1.start_point[0] < node2.start_point[0] or \
-                    (node1.start_point[0] == node2.start_point[0] and node1.start_point[1] < node2.start_point[1]):
-                return -1
-            else:
-                return 1
-
+        # the int key is compared in C without building (row, column) tuples,
+        # and read from the tree-sitter node without the property of BasicNode
         sorted_nodes = sorted(nodes,
-                              key=cmp_to_key(cmp_position),
+                              key=attrgetter('internal.start_byte'),
                               reverse=reverse)
         return sorted_nodes
 
@@ -74,27 +237,90 @@ class Util():
             the extracted string, or None if it fails
         """
 
-        lst = s.split('\n')
         s_row, s_col = start
         e_row, e_col = end
 
         if s_row > e_row or (s_row == e_row and s_col >= e_col):
             return None
 
-        # potential bug: corresponding line does not have enough character
-        if s_row == e_row:
-            return lst[s_row][s_col:e_col]
-        elif s_row + 1 == e_row:
-            return lst[s_row][s_col:] + '\n' + lst[e_row][:e_col]
-        else:
-            return lst[s_row][s_col:] \
-                    + '\n'.join(lst[s_row+1:e_row]) \
-                    + lst[e_row][:e_col]
+        offsets = Util._line_offsets(s)
+
+        def _index(row: int, col: int) -> int:
+            line_start = offsets[row]
+            line_end = offsets[row +
+                               1] - 1 if row + 1 < len(offsets) else len(s)
+            # the column is clipped if the line does not have enough character
+            return line_start + min(col, line_end - line_start)
+
+        return s[_index(s_row, s_col):_index(e_row, e_col)]
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _line_offsets(s: str) -> Tuple[int, ...]:
+        """ the index of the first character of every line in s
+
+        The result is cached for the recently used strings, thus the repeated
+        get_raw on the same source code does not split it again.
+        """
+
+        # every line but the last one is followed by its '\n', the running
+        # sum is computed by accumulate without a loop in the interpreter
+        line_lens = map(len, s.split('\n')[:-1])
+        return (0,) + tuple(accumulate(map((1).__add__, line_lens)))
+
+    @staticmethod
+    def get_raw_by_bytes(src_bytes: bytes, start_byte: int,
+                         end_byte: int) -> str:
+        """ extracts from src_bytes the fragment between the two byte offsets
+
+        Args:
+            src_bytes (bytes): the utf8 encoded source code
+            start_byte (int): the offset of the first byte of the fragment
+            end_byte (int): the offset after the last byte of the fragment
+
+        Return:
+            the decoded fragment
+        """
+
+        return src_bytes[start_byte:end_byte].decode('utf8')
+
+    @staticmethod
+    def get_node_raw_fast(src_bytes: bytes, node) -> str:
+        """ extracts the source code of node from src_bytes
+
+        Unlike get_node_raw, no (row, column) is resolved since the byte
+        offsets of node index src_bytes directly.
+        """
+
+        return Util.get_raw_by_bytes(src_bytes, node.start_byte, node.end_byte)
 
     @staticmethod
     def get_node_raw(s: str, node):
+        """ extracts the source code of node from s, None if node is empty
+
+        For the non-ASCII s, the utf-8 bytes already kept by the wrapper or
+        the tree of node are sliced, s is encoded only if there are none.
+        """
+
         if not node:
             return None
+        if hasattr(node, 'start_byte'):
+            # tree-sitter counts the column in bytes, the byte offsets are
+            # both cheaper and exact for the non-ASCII source code
+            if node.start_byte >= node.end_byte:
+                return None
+            if s.isascii():
+                # the byte offsets are the character indexes, str.isascii
+                # reads a flag of the str without scanning it
+                return s[node.start_byte:node.end_byte]
+            src_bytes = getattr(node, 'internal_src_bytes', None)
+            if src_bytes is not None:
+                return Util.get_node_raw_fast(src_bytes, node)
+            # tree_sitter.Node.text slices the bytes kept by its tree
+            text = getattr(node, 'text', None)
+            if text is not None:
+                return text.decode('utf8')
+            return Util.get_node_raw_fast(s.encode('utf8'), node)
         return Util.get_raw(s, node.start_point, node.end_point)
 
     @staticmethod
@@ -110,14 +336,14 @@ class Util():
             the character index, or None if it fails
         """
 
-        lines = s.split('\n')
-        if row < 0 or row >= len(lines):
+        offsets = Util._line_offsets(s)
+        if row < 0 or row >= len(offsets):
             return None
-        if col < 0 or col >= len(lines[row]):
+        line_end = offsets[row + 1] - 1 if row + 1 < len(offsets) else len(s)
+        if col < 0 or col >= line_end - offsets[row]:
             return None
 
-        index = sum(len(line) + 1 for line in lines[:row])
-        return index + col
+        return offsets[row] + col
 
 
 class Query():
@@ -132,12 +358,20 @@ class Query():
     the ideal node.
 
     Attributes:
-        mapping: a dictionary that maps the query key to the method
+        _MAPPING: a class-level dictionary that maps the query key to the name
+            of the method
 
     Methods:
         query: query the node with the given query
     """
 
+    __slots__ = ()
+
+    _MAPPING = {
+        'type_identifier': '_type_identifier_result',
+        'identifier': '_identifier_result',
+    }
+
     def __init__(self):
         pass
 
@@ -150,13 +384,8 @@ class Query():
         Returns:
             True if the node satisfies the query, otherwise False
         """
-        mapping = {
-            'type_identifier': self._type_identifier_result,
-            'identifier': self._identifier_result,
-        }
-
         for key, value in query.items():
-            if not mapping[key]() == value:
+            if not getattr(self, self._MAPPING[key])() == value:
                 return False
         return True
 
@@ -182,4 +411,4 @@ class Node():
     correspond to the actually existing elements in the source
     code.
     """
-    pass
+    __slots__ = ()
@@ -1,20 +1,62 @@
 import argparse
+import glob
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import List
 from cinspector.interfaces import CCode
 
 
+def _read(path: str) -> str:
+    with open(path, 'r', errors='ignore') as r:
+        return r.read()
+
+
+def _parse_one(path: str) -> str:
+    """ parse the file at path and return its printed tree
+
+    It runs in the worker processes of the directory mode, each of them
+    loads the language once and reuses its parser for all the files.
+    """
+
+    out = io.StringIO()
+    with redirect_stdout(out):
+        CCode(_read(path)).node.print_tree()
+    return out.getvalue()
+
+
+def _source_files(dir_path: str) -> List[str]:
+    files: List[str] = []
+    for _ext in ('*.c', '*.h'):
+        files += glob.glob(os.path.join(dir_path, '**', _ext), recursive=True)
+    return sorted(files)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Print the parsed tree')
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument("-f", "--file", action="store_true")
     group.add_argument("-s", "--string", action="store_true")
+    group.add_argument("-d", "--dir", action="store_true")
     parser.add_argument("target", type=str)
     args = parser.parse_args()
 
     target = args.target
+    if args.dir:
+        if not os.path.isdir(target):
+            parser.error(f'{target} is not a directory')
+        # the files are parsed concurrently, the trees are printed in order
+        files = _source_files(target)
+        with ProcessPoolExecutor(os.cpu_count()) as executor:
+            for _f, _tree in zip(files, executor.map(_parse_one, files)):
+                print(_f)
+                print(_tree, end='')
+        return
+
     content = target
     if args.file:
-        with open(target, 'r', errors='ignore') as r:
-            content = r.read()
+        content = _read(target)
 
     cc = CCode(content)
     cc.node.print_tree()
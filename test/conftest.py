@@ -0,0 +1,23 @@
+import pytest
+from cinspector.interfaces import CCode
+from cinspector.nodes import Util
+
+
+@pytest.fixture(scope="session")
+def ts_parser():
+    # one parser per test process, e.g., per pytest-xdist worker
+    return Util().get_parser()
+
+
+@pytest.fixture(scope="session")
+def parsed():
+    # the CCode of a source is shared by the tests of one process, e.g., one
+    # pytest-xdist worker, thus the tests using it must not edit the nodes
+    return CCode.from_source
+
+
+@pytest.fixture(scope="module")
+def cc(request, parsed):
+    # the CCode of the SRC of the requesting test module, for the tests that
+    # only read the tree
+    return parsed(request.module.SRC)
@@ -0,0 +1,100 @@
+from cinspector.interfaces import CCode
+
+SRC = """
+int a;
+int func(int b) {return b;}
+#ifdef X
+int foo() {return 1;}
+#else
+int foo() {return 2;}
+#endif
+"""
+
+
+class TestCCode:
+
+    def test_get_by_type_name(self):
+        cc = CCode(SRC)
+        # the named types, the anonymous type and the nested same-type nodes
+        for _t in [
+                'identifier', 'function_definition', 'return_statement', ';',
+                'preproc_ifdef', 'compound_statement', '{', 'return', '#ifdef'
+        ]:
+            assert (
+                cc.get_by_type_name(_t) == cc.node.descendants_by_type_name(_t))
+        assert (cc.get_by_type_name('while_statement') == [])
+        assert (cc.get_by_type_name('no_such_type') == [])
+        # the root node is not its own descendant
+        assert (cc.get_by_type_name('translation_unit') == [])
+        # the returned list is not shared by the following calls
+        ids = cc.get_by_type_name('identifier')
+        ids.clear()
+        assert (len(cc.get_by_type_name('identifier')) == 7)
+
+    def test_get_by_type_name_query(self):
+        cc = CCode("""
+#define N (1 + 2)
+struct st { int x; };
+int bar(struct st *s, int c) { return (c > N) ? ((s->x)) : 0; }
+""")
+        expected = {
+            # the body of #define is a preproc_arg, which is not parsed
+            'parenthesized_expression': ['(c > N)', '((s->x))', '(s->x)'],
+            'preproc_def': ['#define N (1 + 2)\n'],
+            'struct_specifier': ['struct st { int x; }', 'struct st'],
+            'parameter_declaration': ['struct st *s', 'int c'],
+        }
+        for _t, _srcs in expected.items():
+            # matched by the compiled query of the type
+            assert (CCode._type_query(_t) is not None)
+            assert ([_.src for _ in cc.get_by_type_name(_t)] == _srcs)
+            assert (
+                cc.get_by_type_name(_t) == cc.node.descendants_by_type_name(_t))
+
+    def test_get_function_by_name(self):
+        cc = CCode(SRC)
+        func = cc.get_function_by_name('func')
+        assert (func.node_type == 'function_definition')
+        assert (func.name.src == 'func')
+        assert (cc.get_function_by_name('foo').src == 'int foo() {return 1;}')
+        assert (cc.get_function_by_name('a') is None)
+
+    def test_parser(self, ts_parser):
+        cc = CCode(SRC, ts_parser)
+        assert (cc.node.internal_tree is not CCode(SRC).node.internal_tree)
+        assert (cc.get_by_type_name('identifier') == CCode(
+            SRC).get_by_type_name('identifier'))
+        assert (cc.get_function_by_name('func').src ==
+                'int func(int b) {return b;}')
+
+    def test_from_source(self):
+        cc = CCode.from_source(SRC)
+        assert (CCode.from_source(SRC) is cc)
+        assert (CCode(SRC) is not cc)
+        assert (CCode.from_source(SRC + '\n') is not cc)
+        assert (cc.get_function_by_name('func').name.src == 'func')
+
+    def test_get_by_type_name_and_query(self):
+        cc = CCode(SRC)
+        foo = cc.get_by_type_name_and_query('function_definition',
+                                            {'identifier': 'foo'})
+        assert ([_.src for _ in foo
+                ] == ['int foo() {return 1;}', 'int foo() {return 2;}'])
+        foo.clear()
+        assert (len(
+            cc.get_by_type_name_and_query('function_definition',
+                                          {'identifier': 'foo'})) == 2)
+        assert (cc.get_by_type_name_and_query('function_definition',
+                                              {'identifier': 'bar'}) == [])
+        # the compiled tree-sitter query is shared by all CCode
+        query = CCode._type_query('function_definition')
+        other = CCode('int foo() {return 3;}')
+        assert (len(
+            other.get_by_type_name_and_query('function_definition',
+                                             {'identifier': 'foo'})) == 1)
+        assert (CCode._type_query('function_definition') is query)
+        # the nodes are indexed by the value of the key once
+        assert (len(cc._query_indexes) == 1)
+        assert (cc.get_by_type_name_and_query(
+            'function_definition',
+            {}) == cc.get_by_type_name('function_definition'))
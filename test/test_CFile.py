@@ -0,0 +1,28 @@
+import os
+from cinspector.interfaces import CFile
+
+SRC = """
+int a;
+int func() {return 0;}
+"""
+
+
+class TestCFile:
+
+    def test_A(self, tmp_path):
+        path = tmp_path / 'a.c'
+        path.write_text(SRC)
+        cf = CFile(str(path))
+        assert (len(cf.get_by_type_name('function_definition')) == 1)
+        node = cf.node
+        # nothing changed
+        assert (not cf.reload())
+        assert (cf.node is node)
+        # mtime changed while the content is the same
+        os.utime(path, ns=(0, 0))
+        assert (not cf.reload())
+        assert (cf.node is node)
+        # content changed
+        path.write_text(SRC + 'int foo() {return 1;}\n')
+        assert (cf.reload())
+        assert (len(cf.get_by_type_name('function_definition')) == 2)
@@ -23,7 +23,7 @@ class TestSort:
         for _id in ids:
             id_dic[_id.src] = _id
         for _ in ['a', 'b', 'c', 'd', 'e']:
-            assert (_ in id_dic.keys())
+            assert (_ in id_dic)
 
         lst = [id_dic['b'], id_dic['e'], id_dic['c'], id_dic['a'], id_dic['d']]
         ascending = Util.sort_nodes(lst)
@@ -40,6 +40,27 @@ class TestSort:
         assert (descending[0].src == 'e')
 
 
+class TestGetRaw:
+
+    def test_A(self):
+        s = "abcs\n12345"
+        assert (Util.get_raw(s, (0, 1), (0, 3)) == 'bc')
+        assert (Util.get_raw(s, (0, 2), (1, 2)) == 'cs\n12')
+        # the column beyond the line is clipped
+        assert (Util.get_raw(s, (0, 2), (0, 9)) == 'cs')
+        assert (Util.get_raw(s, (1, 0), (0, 1)) is None)
+        assert (Util.get_raw(s, (0, 1), (0, 1)) is None)
+
+    def test_multi_line(self):
+        s = "int a;\nint b;\nint c;\nint d;"
+        # the line breaks around the middle lines are kept
+        assert (Util.get_raw(s, (0, 4), (3, 5)) == 'a;\nint b;\nint c;\nint d')
+        cc = CCode(SRC)
+        decls = Util.sort_nodes(cc.get_by_type_name('declaration'))
+        raw = Util.get_raw(SRC, decls[0].start_point, decls[2].end_point)
+        assert (raw == 'int a, b, c = 1;\n    int d;\n    int e;')
+
+
 class TestPoint2Index:
 
     def test_A(self):
@@ -63,3 +84,134 @@ class TestPoint2Index:
         point = (1, 4)
         index = Util.point2index(s, point[0], point[1])
         assert (index == 9)
+
+
+class TestGetTree:
+
+    def test_A(self):
+        util = Util()
+        tree = util.get_tree(SRC)
+        # the tree of the same source is reused
+        assert (util.get_tree(SRC) is tree)
+        assert (Util._is_cached_tree(tree))
+        assert (not Util._is_cached_tree(util.get_parser().parse(b'int a;')))
+
+
+class TestGetParser:
+
+    def test_A(self):
+        import threading
+        util = Util()
+        parser = util.get_parser()
+        # the parser is reused within the thread
+        assert (util.get_parser() is parser)
+        assert (CCode(SRC).node.get_parser() is parser)
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(util.get_parser()))
+        thread.start()
+        thread.join()
+        assert (other[0] is not parser)
+
+    def test_B(self):
+        from concurrent.futures import ThreadPoolExecutor
+        srcs = [f'int v{_i} = {_i};' for _i in range(64)]
+
+        def declared(src):
+            return CCode(src).get_by_type_name('identifier')[0].src
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            names = list(pool.map(declared, srcs))
+        assert (names == [f'v{_i}' for _i in range(64)])
+
+    def test_cold_start(self, monkeypatch):
+        import threading
+        import cinspector.nodes.node as node
+        language = Util._get_language()
+        expected = [
+            language.node_kind_for_id(_i)
+            for _i in range(language.node_kind_count)
+        ]
+        # the first use of the language from several threads at once
+        monkeypatch.setattr(node, '_C_LANGUAGE', None)
+        monkeypatch.setattr(node, '_KIND_NAMES', [])
+        monkeypatch.setattr(node, '_KIND_IDS', dict())
+        barrier = threading.Barrier(8)
+
+        def first_use():
+            barrier.wait()
+            Util._get_language()
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for _t in threads:
+            _t.start()
+        for _t in threads:
+            _t.join()
+        assert ([Util.kind_name(_i) for _i in range(len(expected))] == expected)
+        assert (len(node._KIND_NAMES) == len(expected))
+
+
+class TestGetNodeRaw:
+
+    def test_A(self):
+        cc = CCode(SRC)
+        decls = cc.get_by_type_name('declaration')
+        src_bytes = SRC.encode('utf8')
+        assert (Util.get_node_raw(SRC, decls[0]) == 'int a, b, c = 1;')
+        assert (Util.get_node_raw(SRC, decls[1].internal) == 'int d;')
+        assert (Util.get_node_raw_fast(src_bytes, decls[2]) == 'int e;')
+        assert (Util.get_raw_by_bytes(src_bytes, decls[0].start_byte,
+                                      decls[0].start_byte + 3) == 'int')
+        assert (Util.get_node_raw(SRC, None) is None)
+        # the zero-width node, e.g., the missing ';'
+        src = 'int a'
+        missing = [
+            _n for _n in CCode(src).node.tokenize()
+            if _n.start_byte == _n.end_byte
+        ]
+        assert (missing)
+        assert (Util.get_node_raw(src, missing[0]) is None)
+        assert (Util.get_node_raw(src, missing[0].internal) is None)
+
+    def test_non_ascii(self):
+        src = 'char *s = "中文"; int a;'
+        cc = CCode(src)
+        decls = cc.get_by_type_name('declaration')
+        assert (Util.get_node_raw(src, decls[0]) == 'char *s = "中文";')
+        assert (Util.get_node_raw(src, decls[1]) == 'int a;')
+        assert (Util.get_node_raw(src, decls[0].internal) == 'char *s = "中文";')
+
+
+class TestKindIds:
+
+    def test_A(self):
+        cc = CCode(SRC)
+        for _t in ['identifier', 'declaration', ';']:
+            ids = Util.kind_ids([_t])
+            for _n in cc.get_by_type_name(_t):
+                assert (_n.internal.kind_id in ids)
+        assert (Util.kind_ids([
+            'identifier', 'declaration'
+        ]) == Util.kind_ids(['identifier']) | Util.kind_ids(['declaration']))
+        assert (Util.kind_ids(['no_such_type']) == frozenset())
+
+    def test_kind_name(self):
+        cc = CCode(SRC)
+        for _n in cc.node.descendants():
+            assert (Util.kind_name(_n.internal.kind_id) == _n.internal.type)
+        assert (Util.kind_name(next(iter(Util.kind_ids([';'])))) == ';')
+
+    def test_kind_name_error(self):
+        # the ERROR nodes are of a builtin kind out of the table of the
+        # language
+        cc = CCode('int f( { x = ; }')
+        nodes = cc.node.descendants()
+        assert (any(_n.internal.type == 'ERROR' for _n in nodes))
+        for _n in nodes:
+            assert (_n.node_type == _n.internal.type)
+        assert (cc.get_by_type_name('ERROR')[0].node_type == 'ERROR')
+        errors = cc.node.descendants_by_type_name('ERROR')
+        assert (errors and errors == cc.get_by_type_name('ERROR'))
+        assert (all(_n.is_kind(Util.kind_ids(['ERROR'])) for _n in errors))
+        cc.node.print_tree()
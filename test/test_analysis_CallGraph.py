@@ -50,3 +50,24 @@ class TestCallGraph:
         assert (cg.has_edge(fd, fb))
         assert (cg.has_edge(fd, fc))
         assert (cg.has_node(fe))
+
+    def test_B(self):
+        cc = CCode("""
+#ifdef X
+void f(int a) {}
+#else
+void f(int a, ...) {}
+#endif
+void g() {
+    f(1, 2);
+    h(1);
+}
+""")
+        funcs = cc.get_by_type_name('function_definition')
+        f_fixed, f_variadic, fg = funcs
+        cg = CallGraph(funcs).analysis()
+        assert (list(cg.nodes) == funcs)
+        # the argument number only matches the variadic definition
+        assert (cg.has_edge(fg, f_variadic))
+        assert (not cg.has_edge(fg, f_fixed))
+        assert (len(cg.edges) == 1)
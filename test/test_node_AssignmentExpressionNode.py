@@ -21,3 +21,9 @@ class TestAssignmentNode:
         assert (assignmment_exps[0].symbol == '=')
         assert (assignmment_exps[1].symbol == '+=')
         assert (assignmment_exps[2].symbol == '|=')
+
+    def test_B(self):
+        cc = CCode('void f() { a|=b; s = "é"; s+= t; }')
+        assignmment_exps = cc.get_by_type_name('assignment_expression')
+        assignmment_exps = Util.sort_nodes(assignmment_exps)
+        assert ([_.symbol for _ in assignmment_exps] == ['|=', '=', '+='])
@@ -0,0 +1,199 @@
+from cinspector.interfaces import CCode
+from cinspector.nodes import BasicNode, Util
+
+SRC = """
+int func(int a, int b) {
+    return a + b;
+}
+"""
+
+
+class TestBasicNode:
+
+    def test_parent(self):
+        cc = CCode(SRC)
+        paras = cc.get_by_type_name('parameter_declaration')
+        assert (len(paras) == 2)
+        # siblings share the wrapper of their parent
+        assert (paras[0].parent is paras[1].parent)
+        assert (paras[0].parent.node_type == 'parameter_list')
+        # the top-level nodes lead back to the root node
+        func = cc.get_by_type_name('function_definition')[0]
+        assert (func.parent is cc.node)
+        # the children reached from the parent point back to it
+        for _ch in func.children:
+            assert (_ch.parent is func)
+        assert (cc.node.parent is None)
+
+    def test_eq(self):
+        cc = CCode(SRC)
+        ids_1 = cc.node.descendants_by_type_name('identifier')
+        ids_2 = cc.get_by_type_name('identifier')
+        assert (ids_1 == ids_2)
+        assert (ids_1[0].equal(ids_2[0]))
+        # wrappers of the same node can be used as the same key
+        dic = {_: _.src for _ in ids_1}
+        assert (dic[ids_2[1]] == 'a')
+        # same position while different node_type
+        cc = CCode('int a;')
+        decl = cc.get_by_type_name('declaration')[0]
+        assert (decl.equal(cc.node))
+        assert (decl != cc.node)
+        assert (decl != decl.src)
+
+    def test_children_by_type_name(self):
+        cc = CCode(SRC)
+        func = cc.get_by_type_name('function_definition')[0]
+        paras = func.declarator.parameters
+        decls = paras.children_by_type_name('parameter_declaration')
+        assert ([_.src for _ in decls] == ['int a', 'int b'])
+        assert (paras.children_by_type_name('identifier') == [])
+        # the children of several types keep their order
+        seps = paras.children_by_type_name([',', 'parameter_declaration', '('])
+        assert ([_.src for _ in seps] == ['(', 'int a', ',', 'int b'])
+        assert (paras.children_by_type_name('parameter_declaration') == decls)
+        # the anonymous kinds and ERROR are matched as the named ones
+        cc = CCode('int f( { x = ; }')
+        matched = 0
+        for _n, _ in cc.node._walk_raw(with_root=True):
+            parent = cc.node.make_wrapper(_n)
+            for _t in ['ERROR', '(', ';']:
+                expected = [_ch for _ch in _n.children if _ch.type == _t]
+                found = parent.children_by_type_name(_t)
+                assert ([_.internal for _ in found] == expected)
+                matched += len(expected)
+        assert (matched)
+
+    def test_descendants_skip_types(self):
+        cc = CCode(SRC)
+        func = cc.get_by_type_name('function_definition')[0]
+        ids = func.descendants_by_type_name('identifier')
+        assert ([_.src for _ in ids] == ['func', 'a', 'b', 'a', 'b'])
+        # the parameter_list itself is collected while its subtree is skipped
+        ids = func.descendants_by_type_name(['identifier', 'parameter_list'],
+                                            {'parameter_list'})
+        assert ([_.src for _ in ids] == ['func', '(int a, int b)', 'a', 'b'])
+
+    def test_iter_children(self):
+        cc = CCode(SRC)
+        ret = cc.get_by_type_name('return_statement')[0]
+        assert ([_.src for _ in ret.iter_children()] == ['return', 'a + b'])
+        assert (ret.value.src == 'a + b')
+        assert (CCode('return;').node.children[0].value is None)
+
+    def test_make_wrapper(self):
+        cc = CCode(SRC)
+        func = cc.get_by_type_name('function_definition')[0]
+        # the live wrapper of the same tree-sitter node is reused
+        assert (func.make_wrapper(func.internal) is func)
+        assert (func.declarator is func.children[1])
+        assert (func.body is cc.get_by_type_name('compound_statement')[0])
+        assert (func.make_wrapper(None) is None)
+
+    def test_tokenize(self):
+        cc = CCode(SRC)
+        ret = cc.get_by_type_name('return_statement')[0]
+        assert ([_.src for _ in ret.tokenize()
+                ] == ['return', 'a', '+', 'b', ';'])
+        ids = cc.get_by_type_name('identifier')
+        assert (ids[0].tokenize() == [ids[0]])
+
+    def test_make_wrapper_error(self):
+        cc = CCode('int f( { x = ; }')
+        errors = [_n for _n, _ in cc.node._walk_raw() if _n.type == 'ERROR']
+        assert (errors)
+        for _n in errors:
+            wrapper = cc.node.make_wrapper(_n)
+            assert (type(wrapper) is BasicNode)
+            assert (wrapper.node_type == 'ERROR')
+
+    def test_wrapper_released(self):
+        import gc
+        import weakref
+        cc = CCode(SRC)
+        func = cc.get_by_type_name('function_definition')[0]
+        ts_node = func.internal
+        ref = weakref.ref(func)
+        del func
+        gc.collect()
+        # the wrapper cache does not pin the wrappers
+        assert (ref() is None)
+        func = cc.node.make_wrapper(ts_node)
+        assert (func.node_type == 'function_definition')
+        assert (cc.node.make_wrapper(ts_node) is func)
+
+    def test_src(self):
+        cc = CCode('char *s = "héllo";')
+        lit = cc.get_by_type_name('string_literal')[0]
+        assert (lit.src == '"héllo"')
+        # decoded on the first access only
+        assert (lit.src is lit.src)
+        # the wrappers have no instance __dict__
+        assert (not hasattr(lit, '__dict__'))
+        assert (not hasattr(cc.node, '__dict__'))
+
+    def test_in_front(self):
+        cc = CCode(SRC)
+        ids = cc.get_by_type_name('identifier')
+        assert (ids[0].in_front(ids[1]))
+        assert (not ids[1].in_front(ids[0]))
+        assert (not ids[0].in_front(ids[0]))
+        # the same order as Util.sort_nodes
+        shuffled = ids[::-1]
+        assert (Util.sort_nodes(shuffled) == ids)
+        assert (all(_a.in_front(_b) for _a, _b in zip(ids, ids[1:])))
+
+    def test_parent_rewrapped(self):
+        import gc
+        cc = CCode(SRC)
+        ret = cc.get_by_type_name('return_statement')[0]
+        ts_node = ret.internal
+        assert (ret.parent.node_type == 'compound_statement')
+        del ret
+        gc.collect()
+        # the fresh wrapper finds the parent of the same node again
+        ret = cc.node.make_wrapper(ts_node)
+        assert (ret.parent.node_type == 'compound_statement')
+        assert (ret.parent.parent.node_type == 'function_definition')
+
+    def test_is_kind(self):
+        cc = CCode(SRC)
+        func = cc.get_by_type_name('function_definition')[0]
+        assert (func.is_kind(Util.kind_ids(['function_definition'])))
+        assert (not func.is_kind(Util.kind_ids(['declaration'])))
+        assert (func.kind_id in Util.kind_ids(['function_definition']))
+        # the ids of a frozenset of names are reused
+        names = frozenset({'identifier', ';'})
+        assert (Util.kind_ids(names) is Util.kind_ids(names))
+
+    def test_slots(self):
+        import cinspector.nodes.basic_node as basic_node
+        # every wrapper class declares __slots__, one __dict__ anywhere in
+        # the hierarchy would be inherited by all the wrappers below it
+        classes = [
+            _c for _c in vars(basic_node).values()
+            if isinstance(_c, type) and issubclass(_c, BasicNode)
+        ]
+        assert (len(classes) > 30)
+        for _c in classes:
+            assert ('__slots__' in vars(_c)), _c.__name__
+
+    def test_returned_copies(self):
+        # the wrappers are shared, the lists and dicts they return are not
+        cc = CCode('static const int g(int a) { int b, c; g(a, b); }\n'
+                   'enum E { X, Y };')
+        func = cc.get_by_type_name('function_definition')[0]
+        decl = cc.get_by_type_name('declaration')[0]
+        call = cc.get_by_type_name('call_expression')[0]
+        enum = cc.get_by_type_name('enum_specifier')[0]
+        for _get in [
+                lambda: func.children, lambda: func.type_qualifier,
+                lambda: func.storage_class_specifier,
+                lambda: func.body.statements, lambda: decl.declarator,
+                lambda: call.arguments, lambda: enum.kv
+        ]:
+            returned = _get()
+            assert (returned)
+            expected = list(returned)
+            returned.clear()
+            assert (list(_get()) == expected)
@@ -1,4 +1,3 @@
-from cinspector.interfaces import CCode
 from cinspector.nodes import IdentifierNode, DeclarationNode, FunctionDefinitionNode, Util
 
 SRC = """
@@ -17,13 +16,9 @@ pcap_t *pcap_open_rpcap(const char *source, int snaplen, int flags,
 
 class TestDeclarationNode:
 
-    def test_A(self):
-        cc = CCode(SRC)
+    def test_A(self, cc):
         # locate funcA
-        funcs = cc.get_by_type_name('function_definition')
-        for _f in funcs:
-            if _f.name.src == 'funcA':
-                funcA = _f
+        funcA = cc.get_function_by_name('funcA')
         assert (funcA)
         # test
         declarations = funcA.descendants_by_type_name('declaration')
@@ -37,15 +32,11 @@ class TestDeclarationNode:
         ids = declaration.declared_identifiers()
         assert (len(ids) == 3)
         for _ in ids:
-            assert (_.src in ['a', 'b', 'c'])
+            assert (_.src in {'a', 'b', 'c'})
 
-    def test_B(self):
-        cc = CCode(SRC)
-        # locate funcA
-        funcs = cc.get_by_type_name('function_definition')
-        for _f in funcs:
-            if _f.name.src == 'funcB':
-                funcB = _f
+    def test_B(self, cc):
+        # locate funcB
+        funcB = cc.get_function_by_name('funcB')
         assert (funcB)
         # test
         declarations = funcB.descendants_by_type_name('declaration')
@@ -59,12 +50,20 @@ class TestDeclarationNode:
         ids = declaration.declared_identifiers()
         assert (len(ids) == 3)
         for _ in ids:
-            assert (_.src in ['ins', 'ins_pointer', 'ins_arr'])
+            assert (_.src in {'ins', 'ins_pointer', 'ins_arr'})
 
-    def test_C(self):
+    def test_C(self, cc):
         # test function declarator in declaration
-        cc = CCode(SRC)
         decls = cc.get_by_type_name('declaration')
         decls = Util.sort_nodes(decls)
         pcap_decl = decls[-1]
         assert (pcap_decl.declared_identifiers()[0].src == 'pcap_open_rpcap')
+
+    def test_D(self, cc):
+        decl = cc.get_by_type_name('declaration')[0]
+        ids = decl.declared_identifiers()
+        ids.clear()
+        # the cached identifiers are not affected by the caller
+        assert ([_.src for _ in decl.declared_identifiers()] == ['a', 'b', 'c'])
+        assert (decl.declared_identifiers()[0]
+                is decl.declared_identifiers()[0])
@@ -24,6 +24,64 @@ class TestEdit:
         new_func = func_edit.remove_child(call_exp)
         assert (new_func.node_type == 'function_definition')
         assert (new_func.descendants_by_type_name('call_expression') == [])
+        # the edited tree is private to the returned nodes, a CCode of the
+        # edited source parses its own tree
+        new_cc = CCode(new_func.internal_src)
+        assert (new_cc.node.internal_tree is not new_func.internal_tree)
+        # the result can be edited again
+        decl = new_func.descendants_by_type_name('declaration')[0]
+        new_func = Edit(new_func).remove_child(decl)
+        assert (new_func.body.src.split() == ['{', '}'])
+        # without affecting the CCode of the edited source
+        assert (len(new_cc.get_by_type_name('declaration')) == 1)
+        # the edited tree is no longer served for the original source
+        cc = CCode(SRC)
+        assert (len(cc.get_by_type_name('call_expression')) == 1)
+
+    def test_other_ccode(self):
+        cc = CCode(SRC)
+        other = CCode(SRC)
+        src = other.node.src
+        tokens = other.node.tokenize().srcs()
+        func = cc.get_by_type_name('function_definition')[0]
+        call_exp = func.descendants_by_type_name('expression_statement')[0]
+        Edit(func).remove_child(call_exp)
+        # the CCode of the same source is not affected by the edit
+        assert (other.node.src == src)
+        assert (other.node.tokenize().srcs() == tokens)
+        assert (CCode(SRC).node.tokenize().srcs() == tokens)
+        assert (len(other.get_by_type_name('call_expression')) == 1)
+
+    def test_private_tree(self, ts_parser):
+        # the tree parsed by the given parser is not shared, it is edited
+        # in place and parsed incrementally
+        cc = CCode(SRC, parser=ts_parser)
+        func = cc.get_by_type_name('function_definition')[0]
+        call_exp = func.descendants_by_type_name('expression_statement')[0]
+        new_func = Edit(func).remove_child(call_exp)
+        assert (new_func.descendants_by_type_name('call_expression') == [])
+        assert (cc.node.internal_tree.root_node.has_changes)
+        # the shared tree is left untouched
+        shared = CCode(SRC)
+        func = shared.get_by_type_name('function_definition')[0]
+        call_exp = func.descendants_by_type_name('expression_statement')[0]
+        Edit(func).remove_child(call_exp)
+        assert (not shared.node.internal_tree.root_node.has_changes)
+
+    def test_nested(self):
+        cc = CCode(SRC + 'void c() {\n    if (1) { d(); e(); }\n}\n')
+        body = cc.get_by_type_name('compound_statement')[-1]
+        assert (body.src == '{ d(); e(); }')
+        new_body = Edit(body).remove_child(body.statements[0])
+        assert (new_body.node_type == 'compound_statement')
+        assert (new_body.src == '{  e(); }')
+
+    def test_non_ascii(self):
+        cc = CCode('void a() {\n    puts("héllo");\n    b(0);\n}\n')
+        func = cc.get_by_type_name('function_definition')[0]
+        call_exp = func.descendants_by_type_name('expression_statement')[1]
+        new_func = Edit(func).remove_child(call_exp)
+        assert (new_func.src == 'void a() {\n    puts("héllo");\n    \n}')
 
     def test_edit_str(self):
         s = "012345678"
@@ -45,3 +103,20 @@ class TestEdit:
         edits.append(EditPos(1, 4, "a"))
         s = edit_str(s, edits)
         assert (s == None)
+
+        # insertion, deletion and non-ASCII snippets, given in any order
+        s = "0123456é8"
+        edits = []
+        edits.append(EditPos(7, 8, "ü"))
+        edits.append(EditPos(2, 2, "xyz"))
+        edits.append(EditPos(4, 6, ""))
+        s = edit_str(s, edits)
+        assert (s == '01xyz236ü8')
+
+        # adjacent edits are allowed while the negative start is not
+        s = "012345678"
+        s = edit_str(s, [EditPos(3, 5, "b"), EditPos(1, 3, "a")])
+        assert (s == '0ab5678')
+        s = "012345678"
+        s = edit_str(s, [EditPos(-1, 2, "a")])
+        assert (s == None)
@@ -1,4 +1,3 @@
-from cinspector.interfaces import CCode
 from cinspector.nodes import EnumSpecifierNode, IdentifierNode, NumberLiteralNode
 
 SRC = """
@@ -37,13 +36,20 @@ enum E {
     E4 = MACRO2
 };
 
+enum F {
+    F1,
+#ifdef CONFIG
+    F2 = 5,
+#endif
+    F3
+};
+
 """
 
 
 class TestEnumSpecifierNode:
 
-    def test_A(self):
-        cc = CCode(SRC)
+    def test_A(self, cc):
 
         def conditionA(n):
             if n.node_type == 'enum_specifier':
@@ -67,8 +73,7 @@ class TestEnumSpecifierNode:
         assert (k.src == 'A1')
         assert (value_dic[k] == 0)
 
-    def test_B(self):
-        cc = CCode(SRC)
+    def test_B(self, cc):
         enum = cc.get_by_type_name_and_query('enum_specifier',
                                              {'type_identifier': 'B'})[0]
         # test EnumSpecifierNode.kv
@@ -81,8 +86,7 @@ class TestEnumSpecifierNode:
             elif _k.src == 'B2':
                 assert (_v == 1)
 
-    def test_C(self):
-        cc = CCode(SRC)
+    def test_C(self, cc):
         enum = cc.get_by_type_name_and_query('enum_specifier',
                                              {'type_identifier': 'C'})[0]
         # test EnumSpecifierNode.kv
@@ -103,8 +107,7 @@ class TestEnumSpecifierNode:
             else:
                 assert (False)
 
-    def test_D(self):
-        cc = CCode(SRC)
+    def test_D(self, cc):
         enum = cc.get_by_type_name_and_query('enum_specifier',
                                              {'type_identifier': 'D'})[0]
         # test EnumSpecifierNode.kv
@@ -132,8 +135,7 @@ class TestEnumSpecifierNode:
             else:
                 assert (False)
 
-    def test_E(self):
-        cc = CCode(SRC)
+    def test_E(self, cc):
         enum = cc.get_by_type_name_and_query('enum_specifier',
                                              {'type_identifier': 'E'})[0]
         # test EnumSpecifierNode.kv
@@ -187,3 +189,18 @@ class TestEnumSpecifierNode:
                 assert (_v == 2)
             else:
                 assert (False)
+
+    def test_F(self, cc):
+        enum = cc.get_by_type_name_and_query('enum_specifier',
+                                             {'type_identifier': 'F'})[0]
+        # enumerators nested in preprocessor directives are collected
+        assert ([_.src for _ in enum.kv.keys()] == ['F1', 'F2', 'F3'])
+        for _k, _v in enum.conclude_value().items():
+            if _k.src == 'F1':
+                assert (_v == 0)
+            elif _k.src == 'F2':
+                assert (_v == 5)
+            elif _k.src == 'F3':
+                assert (_v == 6)
+            else:
+                assert (False)
@@ -1,4 +1,3 @@
-from cinspector.interfaces import CCode
 from cinspector.nodes import FunctionDefinitionNode, ParameterListNode, IdentifierNode
 
 SRC = """
@@ -18,8 +17,7 @@ int (*bar(int (*cmp)(void *)))(int) {
 
 class TestFunctionDefinitionNode:
 
-    def test_func(self):
-        cc = CCode(SRC)
+    def test_func(self, cc):
         func = cc.get_by_type_name('function_definition')
 
         # test the property name
@@ -59,8 +57,7 @@ class TestFunctionDefinitionNode:
         assert (isinstance(para3.name, IdentifierNode))
         assert (str(para3.name.src == 'ins_pointer_arr'))
 
-    def test_foo(self):
-        cc = CCode(SRC)
+    def test_foo(self, cc):
         foo = cc.get_by_type_name_and_query('function_definition',
                                             {'identifier': 'foo'})[0]
         # test the property parameters
@@ -69,8 +66,7 @@ class TestFunctionDefinitionNode:
         assert (para_decl1.name.src == 'func_pointer')
         assert (para_decl1.src == 'int (*func_pointer)(const static int *)')
 
-    def test_bar(self):
-        cc = CCode(SRC)
+    def test_bar(self, cc):
         bar = cc.get_by_type_name_and_query('function_definition',
                                             {'identifier': 'bar'})[0]
 
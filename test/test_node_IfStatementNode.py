@@ -42,3 +42,15 @@ class TestIfStatementNode:
                 assert ('b == 20' in str(_))
             else:
                 assert (False)
+
+    def test_B(self):
+        cc = CCode('if (a && (b || c) && (d || e)) {}')
+        stmt = cc.get_by_type_name('if_statement')[0]
+        # the conjunction distributes over both disjunctions
+        constraints = stmt.entry_constraints()
+        assert ([[_.src for _ in _c] for _c in constraints] == [['a', 'b', 'd'],
+                                                                ['a', 'b', 'e'],
+                                                                ['a', 'c', 'd'],
+                                                                ['a', 'c',
+                                                                 'e']])
+        assert ([_.src for _ in stmt.common_entry_constraints()] == ['a'])
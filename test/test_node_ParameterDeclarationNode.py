@@ -18,10 +18,8 @@ int (*bar(int (*cmp)(void *)))(int) {
 
 class TestParameterDeclarationNode:
 
-    def test_func(self):
-        cc = CCode(SRC)
-        func = cc.get_by_type_name('function_definition')
-        func = [_ for _ in func if _.name.src == 'func'][0]
+    def test_func(self, cc):
+        func = cc.get_function_by_name('func')
         para_decl_lst = func.descendants_by_type_name('parameter_declaration')
         # number of the parameter
         assert (len(para_decl_lst) == 4)
@@ -48,12 +46,14 @@ class TestParameterDeclarationNode:
         para3 = para_decl_lst[3]
         assert (str(para3.type.src) == 'struct st')
         assert (isinstance(para3.name, IdentifierNode))
-        assert (str(para3.name.src == 'ins_pointer_arr'))
+        assert (para3.name.src == 'ins_pointer_arr')
 
-    def test_foo(self):
-        cc = CCode(SRC)
-        foo = cc.get_by_type_name('function_definition')
-        foo = [_ for _ in foo if _.name.src == 'foo'][0]
+        # the fields are looked up once per wrapper
+        assert (para3.type is para3.type)
+        assert (para3.declarator is para3.declarator)
+
+    def test_foo(self, cc):
+        foo = cc.get_function_by_name('foo')
 
         # int (*func_pointer)(const static int *)
         para_decl1 = foo.child_by_field_name('declarator').child_by_field_name(
@@ -67,10 +67,8 @@ class TestParameterDeclarationNode:
         assert (para_decl2.type_qualifier[0].src == 'const')
         assert (para_decl2.storage_class_specifier[0].src == 'static')
 
-    def test_bar(self):
-        cc = CCode(SRC)
-        bar = cc.get_by_type_name('function_definition')
-        bar = [_ for _ in bar if _.name.src == 'bar'][0]
+    def test_bar(self, cc):
+        bar = cc.get_function_by_name('bar')
 
         # int (*bar(int (*cmp)(void *)))(int)
         para_decl_lst = bar.descendants_by_type_name('parameter_declaration')
@@ -83,3 +81,22 @@ class TestParameterDeclarationNode:
                 assert (_decl.name is None)
             else:
                 assert (0)
+
+    def test_type_level(self):
+        cc = CCode('void f(int a, char **p, int *q[], int x[2][3], '
+                   'int (*fp)(int), int *);')
+        levels = [(_.type.pointer_level, _.type.array_level)
+                  for _ in cc.get_by_type_name('parameter_declaration')]
+        # the pointer of the function pointer is not of its return type
+        assert (levels == [(0, 0), (2, 0), (1, 1), (0, 2), (0, 0), (0, 0),
+                           (1, 0)])
+        paras = cc.get_by_type_name('parameter_declaration')
+        assert (paras[2].type.is_pointer() and paras[2].type.is_array())
+        assert (not paras[0].type.is_pointer())
+
+    def test_abstract_declarator(self):
+        # the abstract declarators name nothing
+        cc = CCode('int f(int (*)(int), int [3], int *);')
+        paras = cc.node.descendants_by_type_name('parameter_declaration')
+        assert (len(paras) == 4)
+        assert ([_.name for _ in paras] == [None] * 4)
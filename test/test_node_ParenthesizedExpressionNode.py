@@ -18,13 +18,27 @@ class TestParenthesizedExpressionNode:
         cc = CCode(SRC)
         pe = cc.get_by_type_name('parenthesized_expression')
         assert (len(pe) == 3)
+        expected = {
+            '(a > 10)': 'a > 10',
+            '((a > 10 && b < 20) || b == 20)': '(a > 10 && b < 20) || b == 20',
+            '(a > 10 && b < 20)': 'a > 10 && b < 20',
+        }
         for _ in pe:
-            if _.src == '(a > 10)':
-                assert (_.remove_parenthese().src == 'a > 10')
-            elif _.src == '((a > 10 && b < 20) || b == 20)':
-                assert (_.remove_parenthese().src ==
-                        '(a > 10 && b < 20) || b == 20')
-            elif _.src == '(a > 10 && b < 20)':
-                assert (_.remove_parenthese().src == 'a > 10 && b < 20')
-            else:
-                assert (False)
+            assert (_.remove_parenthese().src == expected[_.src])
+        # every expected expression is met
+        assert ({_.src for _ in pe} == expected.keys())
+
+    def test_src_bytes(self):
+        cc = CCode(SRC)
+        pe = cc.get_by_type_name('parenthesized_expression')
+        assert ([_.src_bytes for _ in pe] == [
+            b'(a > 10)', b'((a > 10 && b < 20) || b == 20)',
+            b'(a > 10 && b < 20)'
+        ])
+        assert (all(_.src_bytes.decode() == _.src for _ in pe))
+
+    def test_comment(self):
+        cc = CCode('int x = ( /* c */ a > 1);')
+        pe = cc.get_by_type_name('parenthesized_expression')[0]
+        assert (pe.remove_parenthese().src == 'a > 1')
+        assert (pe.remove_parenthese() is pe.children[1])
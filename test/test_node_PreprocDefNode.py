@@ -25,3 +25,8 @@ class TestPreprocDefNode:
                 assert (_.value.src == 'MACRO1')
             else:
                 assert (False)
+
+    def test_non_ascii(self):
+        cc = CCode('#define S "中文"  \n')
+        macro = cc.get_by_type_name('preproc_def')[0]
+        assert (macro.value.src == '"中文"')
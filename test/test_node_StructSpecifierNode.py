@@ -43,3 +43,12 @@ class TestStructSpecifierNode:
                                                   {'type_identifier': 'st'})[0]
         assert (isinstance(struct_st, StructSpecifierNode))
         assert (struct_st.name.src == 'st')
+
+    def test_iter_field_declarations(self):
+        cc = CCode(SRC)
+        body = cc.get_by_type_name('struct_specifier')[0].body
+        decls = body.iter_field_declarations()
+        assert (next(decls).src == 'int a;')
+        assert (isinstance(next(decls), FieldDeclarationNode))
+        assert (next(decls, None) is None)
+        assert (list(body.iter_field_declarations()) == body.children)
@@ -17,22 +17,35 @@ void BND_Fixup(void) {
 
 class TestTokenize:
 
-    def test_A(self):
-        cc = CCode(SRC)
-        tokens = cc.node.tokenize()
-        tokens = [_.src for _ in tokens]
+    def test_A(self, parsed):
+        cc = parsed(SRC)
+        # compared as bytes, the tokens are not decoded
+        tokens = cc.node.tokenize().src_bytes()
         assert tokens == [
-            'int', 'a', ',', 'b', ',', 'c', '=', '1', ';', 'int', 'd', ';',
-            'int', 'e', ';'
+            b'int', b'a', b',', b'b', b',', b'c', b'=', b'1', b';', b'int',
+            b'd', b';', b'int', b'e', b';'
         ]
 
-    def test_B(self):
-        cc = CCode(SRC1)
-        tokens = cc.node.tokenize()
-        tokens = [_.src for _ in tokens]
+    def test_B(self, parsed):
+        cc = parsed(SRC1)
+        tokens = cc.node.tokenize().srcs()
         assert tokens == [
             'void', 'BND_Fixup', '(', 'void', ')', '{', 'if', '(', '(', '(',
             'byte', ')', 'prefixes', '&', '2', ')', ')', '{', '*', '(',
             'undefined4', '*', ')', '(', 'all_prefixes', '+', '(', 'long', ')',
             'last_repnz_prefix', '*', '4', ')', '=', '0x4f2', ';', '}', '}'
         ]
+
+    def test_C(self):
+        cc = CCode('/* h\u00e9llo */ int a, b;')
+        tokens = cc.node.tokenize()
+        assert (len(tokens) == 6)
+        assert (tokens.get_src(0) == '/* h\u00e9llo */')
+        # the wrapped tokens agree with the byte offsets
+        assert ([_.src for _ in tokens] == tokens.srcs())
+        assert (tokens[0].node_type == 'comment')
+        assert (tokens[-1] is tokens[5])
+        assert ([_.src for _ in tokens[1:3]] == ['int', 'a'])
+        assert (tokens.starts[2] == tokens[2].start_byte)
+        assert (tokens.src_bytes() == [_.encode() for _ in tokens.srcs()])
+        assert (tokens.src_bytes()[0] == '/* h\u00e9llo */'.encode())
@@ -0,0 +1,44 @@
+import sys
+import pytest
+from cinspector.parser import main, _parse_one, _source_files
+
+SRC = """
+int func() {return 0;}
+"""
+
+
+class TestParser:
+
+    def test_A(self, tmp_path, monkeypatch, capsys):
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / 'a.c').write_text(SRC)
+        (tmp_path / 'sub' / 'b.h').write_text('int a;\n')
+        (tmp_path / 'c.txt').write_text('int b;\n')
+        files = _source_files(str(tmp_path))
+        assert (files == [str(tmp_path / 'a.c'), str(tmp_path / 'sub' / 'b.h')])
+        assert (_parse_one(files[0]) != '')
+
+        monkeypatch.setattr(sys, 'argv', ['cinspector', '-d', str(tmp_path)])
+        main()
+        out = capsys.readouterr().out
+        # the trees are printed in the order of the files
+        assert (out.index(files[0]) < out.index(files[1]))
+        assert (out.count('function_definition') == 1)
+        assert ('c.txt' not in out)
+
+    def test_B(self, tmp_path, monkeypatch, capsys):
+        # directory mode on a missing directory or a file is an error
+        path = tmp_path / 'a.c'
+        path.write_text(SRC)
+        for _target in (tmp_path / 'missing', path):
+            monkeypatch.setattr(sys, 'argv', ['cinspector', '-d', str(_target)])
+            with pytest.raises(SystemExit) as e:
+                main()
+            assert (e.value.code == 2)
+            assert ('is not a directory' in capsys.readouterr().err)
+
+    def test_C(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'argv', ['cinspector', '-s', SRC])
+        main()
+        out = capsys.readouterr().out
+        assert ('function_definition' in out)